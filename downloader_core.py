@@ -1,5 +1,6 @@
 from yt_dlp import YoutubeDL
 from yt_dlp.utils import DownloadError
+import copy
 import os
 import re
 import sys
@@ -432,6 +433,57 @@ def fetch_generic_playlist_info(url: str, audio_only: bool = False) -> Dict[str,
             'videos': videos,
         }
 
+
+# Enhanced options for maximum download speed and SSL support. Built once at
+# import; every download deep-copies them so yt-dlp never shares the nested
+# dicts/lists between (possibly concurrent) downloads.
+_ENHANCED_OPTS: Dict[str, Any] = {
+    # SSL/TLS options for secure connections
+    'hls_prefer_native': True,
+    'external_downloader': {
+        'default': 'ffmpeg',
+        'm3u8': 'ffmpeg',
+        'm3u8_native': 'ffmpeg',
+    },
+    'external_downloader_args': {
+        'ffmpeg': [
+            '-loglevel', 'error',
+            '-reconnect', '1',
+            '-reconnect_streamed', '1',
+            '-reconnect_delay_max', '5',
+            '-rw_timeout', '30000000',  # 30 seconds timeout
+            '-bufsize', '256K',  # Smaller buffer for more frequent updates
+            '-maxrate', '0',  # No limit
+            '-minrate', '0',  # No limit
+            '-fflags', '+discardcorrupt',
+            '-fflags', '+fastseek',
+            '-fflags', '+genpts',
+            '-fflags', '+igndts',
+        ]
+    },
+    # Network optimization options
+    'socket_timeout': 30,
+    'retries': 10,
+    'fragment_retries': 10,
+    'retry_sleep_functions': {
+        'http': lambda n: 2 ** n,
+        'fragment': lambda n: 2 ** n,
+        'file_access': lambda n: 2 ** n,
+    },
+    'buffersize': 256 * 1024,  # 256KB buffer for more frequent updates
+    'concurrent_fragment_downloads': 3,  # Reduced for better progress tracking
+    # Security options
+    'no_check_certificate': False,
+    'prefer_insecure': False,
+    # Performance options
+    'no_mtime': True,
+    'nopart': False,
+    'continuedl': True,
+    # Progress tracking options
+    'progress_delta': 0.5,  # Update progress every 0.5%
+}
+
+
 def download_single_video_with_progress(
     url: str,
     output_path: str,
@@ -442,52 +494,7 @@ def download_single_video_with_progress(
     fetch_all: bool = False,
     progress_hook: Optional[Callable] = None
 ) -> dict:
-    # Enhanced options for maximum download speed and SSL support
-    enhanced_opts: Dict[str, Any] = {
-        # SSL/TLS options for secure connections
-        'hls_prefer_native': True,
-        'external_downloader': {
-            'default': 'ffmpeg',
-            'm3u8': 'ffmpeg',
-            'm3u8_native': 'ffmpeg',
-        },
-        'external_downloader_args': {
-            'ffmpeg': [
-                '-loglevel', 'error',
-                '-reconnect', '1',
-                '-reconnect_streamed', '1',
-                '-reconnect_delay_max', '5',
-                '-rw_timeout', '30000000',  # 30 seconds timeout
-                '-bufsize', '256K',  # Smaller buffer for more frequent updates
-                '-maxrate', '0',  # No limit
-                '-minrate', '0',  # No limit
-                '-fflags', '+discardcorrupt',
-                '-fflags', '+fastseek',
-                '-fflags', '+genpts',
-                '-fflags', '+igndts',
-            ]
-        },
-        # Network optimization options
-        'socket_timeout': 30,
-        'retries': 10,
-        'fragment_retries': 10,
-        'retry_sleep_functions': {
-            'http': lambda n: 2 ** n,
-            'fragment': lambda n: 2 ** n,
-            'file_access': lambda n: 2 ** n,
-        },
-        'buffersize': 256 * 1024,  # 256KB buffer for more frequent updates
-        'concurrent_fragment_downloads': 3,  # Reduced for better progress tracking
-        # Security options
-        'no_check_certificate': False,
-        'prefer_insecure': False,
-        # Performance options
-        'no_mtime': True,
-        'nopart': False,
-        'continuedl': True,
-        # Progress tracking options
-        'progress_delta': 0.5,  # Update progress every 0.5%
-    }
+    enhanced_opts = copy.deepcopy(_ENHANCED_OPTS)
     
     # Handle image fetching for social media platforms
     if fetch_images or fetch_all:
@@ -505,9 +512,6 @@ def download_single_video_with_progress(
         # Apply enhanced options
         image_ydl_opts.update(enhanced_opts)
         
-        # Apply enhanced options
-        image_ydl_opts.update(enhanced_opts)
-        
         # Special handling for YouTube - download only thumbnails
         if 'youtube.com' in url or 'youtu.be' in url:
             # For YouTube, when image format is selected, download only the thumbnail
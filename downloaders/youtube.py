@@ -3,7 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional, List, Dict
 
-from PySide6.QtCore import Qt, QThread
+from PySide6.QtCore import QObject, Qt, QThreadPool, QTimer
 from PySide6.QtWidgets import (
 	QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QComboBox,
 	QFileDialog, QScrollArea, QGroupBox, QCheckBox, QProgressBar, QWidget as _QW
@@ -60,11 +60,17 @@ class YouTubeWidget(QWidget):
 	def __init__(self, ffmpeg_location: Optional[str], parent: Optional[_QW] = None) -> None:
 		super().__init__(parent)
 		self.ffmpeg_location = ffmpeg_location
-		self._info_thread: Optional[QThread] = None
+		# Workers run on a pool instead of a QThread each; the pool is our own so
+		# other windows resizing the global pool don't limit this widget
+		self._pool = QThreadPool(self)
 		self._info_worker: Optional[YouTubeInfoWorker] = None
-		self._dl_thread: Optional[QThread] = None
 		self._dl_worker: Optional[YouTubeDownloadWorker] = None
 		self._info: Optional[Dict] = None
+		self._dl_single = False
+		# Polls the download worker's latest progress snapshot while it runs
+		self._progress_timer = QTimer(self)
+		self._progress_timer.setInterval(60)
+		self._progress_timer.timeout.connect(self._poll_download_progress)
 
 		root = QVBoxLayout(self)
 		root.setContentsMargins(12, 4, 12, 12)
@@ -198,17 +204,14 @@ class YouTubeWidget(QWidget):
 			return
 		self.btn_load.setEnabled(False)
 		audio_only = False  # we will offer MP3 later in single view
-		self._info_thread = QThread(self)
 		self._info_worker = YouTubeInfoWorker(url, audio_only)
-		self._info_worker.moveToThread(self._info_thread)
-		self._info_thread.started.connect(self._info_worker.run)
 		self._info_worker.sig_info.connect(self._on_info)
 		self._info_worker.sig_error.connect(self._on_info_error)
-		self._info_thread.start()
+		self._info_worker.sig_done.connect(lambda w=self._info_worker: self._release_worker(w))
+		self._pool.start(self._info_worker.run)
 
 	def _on_info(self, info: Dict) -> None:
 		self.btn_load.setEnabled(True)
-		self._teardown_thread("info")
 		self._info = info
 		ctype = info.get("type")
 		if ctype == "video":
@@ -222,7 +225,6 @@ class YouTubeWidget(QWidget):
 
 	def _on_info_error(self, msg: str) -> None:
 		self.btn_load.setEnabled(True)
-		self._teardown_thread("info")
 
 	def _populate_single(self, info: Dict) -> None:
 		self.quality_combo.clear()
@@ -278,18 +280,13 @@ class YouTubeWidget(QWidget):
 
 	def _start_download(self, videos: List[Dict], out_dir: str, audio_only: bool, single: bool) -> None:
 		Path(out_dir).mkdir(parents=True, exist_ok=True)
-		self._dl_thread = QThread(self)
 		self._dl_worker = YouTubeDownloadWorker(videos, out_dir, audio_only)
-		self._dl_worker.moveToThread(self._dl_thread)
-		self._dl_thread.started.connect(self._dl_worker.run)
-		if single:
-			self._dl_worker.sig_item_progress.connect(lambda idx, p: self.progress.setValue(int(p)))
-			self._dl_worker.sig_progress.connect(lambda p: None)
-		else:
-			self._dl_worker.sig_progress.connect(lambda p: self.playlist_progress.setValue(int(p)))
+		self._dl_single = single
 		self._dl_worker.sig_finished.connect(self._on_download_finished)
 		self._dl_worker.sig_error.connect(self._on_download_error)
-		self._dl_thread.start()
+		self._dl_worker.sig_done.connect(lambda w=self._dl_worker: self._release_worker(w))
+		self._pool.start(self._dl_worker.run)
+		self._progress_timer.start()
 		# toggle buttons
 		if single:
 			self.btn_download.setEnabled(False)
@@ -298,15 +295,25 @@ class YouTubeWidget(QWidget):
 			self.btn_download_all.setEnabled(False)
 			self.btn_cancel_all.setEnabled(True)
 
+	def _poll_download_progress(self) -> None:
+		latest = self._dl_worker.latest() if self._dl_worker is not None else None
+		if latest is None:
+			return
+		_idx, item_percent, overall = latest
+		if self._dl_single:
+			self.progress.setValue(int(item_percent))
+		else:
+			self.playlist_progress.setValue(int(overall))
+
 	def _on_download_error(self, msg: str) -> None:
-		self._teardown_thread("dl")
+		self._progress_timer.stop()
 		self.btn_download.setEnabled(True)
 		self.btn_cancel.setEnabled(False)
 		self.btn_download_all.setEnabled(True)
 		self.btn_cancel_all.setEnabled(False)
 
 	def _on_download_finished(self, summary: Dict) -> None:
-		self._teardown_thread("dl")
+		self._progress_timer.stop()
 		self.btn_download.setEnabled(True)
 		self.btn_cancel.setEnabled(False)
 		self.btn_download_all.setEnabled(True)
@@ -321,24 +328,13 @@ class YouTubeWidget(QWidget):
 		self.btn_cancel.setEnabled(False)
 		self.btn_cancel_all.setEnabled(False)
 
-	def _teardown_thread(self, kind: str) -> None:
-		if kind == "info":
-			if self._info_worker is not None:
-				self._info_worker.deleteLater()
-				self._info_worker = None
-			if self._info_thread is not None:
-				self._info_thread.quit()
-				self._info_thread.wait()
-				self._info_thread.deleteLater()
-				self._info_thread = None
-		elif kind == "dl":
-			if self._dl_worker is not None:
-				self._dl_worker.deleteLater()
-				self._dl_worker = None
-			if self._dl_thread is not None:
-				self._dl_thread.quit()
-				self._dl_thread.wait()
-				self._dl_thread.deleteLater()
-				self._dl_thread = None
+	def _release_worker(self, worker: QObject) -> None:
+		# Runs on sig_done, i.e. once the worker's pool task has returned, so
+		# only that worker is dropped and nothing still running is deleted
+		if self._info_worker is worker:
+			self._info_worker = None
+		elif self._dl_worker is worker:
+			self._dl_worker = None
+		worker.deleteLater()
 
 
@@ -10,6 +10,10 @@ except Exception:
     from app_config import CACHE_PATH  # minimal fallback; API keys should be provided elsewhere
 from utils import debug_log
 
+# One pooled session for every Firebase call, so auth and Firestore requests
+# reuse the same keep-alive TCP/TLS connections instead of handshaking each time
+_http = requests.Session()
+
 class FirebaseClient:
     """
     Lightweight Firebase REST wrapper for Authentication and Firestore operations
@@ -53,7 +57,7 @@ class FirebaseClient:
         """Create a new Firebase Authentication user (email/password)."""
         url = FirebaseClient._auth_url("accounts:signUp")
         payload = {"email": email, "password": password, "returnSecureToken": True}
-        r = requests.post(url, json=payload, timeout=15)
+        r = _http.post(url, json=payload, timeout=15)
         return r.json()
 
     @staticmethod
@@ -61,7 +65,7 @@ class FirebaseClient:
         """Sign in a user with email and password; cache idToken and expiry locally."""
         url = FirebaseClient._auth_url("accounts:signInWithPassword")
         payload = {"email": email, "password": password, "returnSecureToken": True}
-        r = requests.post(url, json=payload, timeout=15)
+        r = _http.post(url, json=payload, timeout=15)
         data = r.json()
         if "idToken" in data:
             try:
@@ -85,7 +89,7 @@ class FirebaseClient:
         """Refresh an ID token using a refresh token."""
         url = f"https://securetoken.googleapis.com/v1/token?key={FIREBASE_API_KEY}"
         payload = {"grant_type": "refresh_token", "refresh_token": refresh_token}
-        r = requests.post(url, data=payload, timeout=15)
+        r = _http.post(url, data=payload, timeout=15)
         return r.json()
 
     @staticmethod
@@ -144,7 +148,7 @@ class FirebaseClient:
             field_paths = list(data.keys())
             url += f"?updateMask.fieldPaths={'&updateMask.fieldPaths='.join(field_paths)}"
         
-        r = requests.patch(url, json=payload, headers=headers, timeout=15)
+        r = _http.patch(url, json=payload, headers=headers, timeout=15)
         return r.json()
 
     @staticmethod
@@ -152,7 +156,7 @@ class FirebaseClient:
         """Read a Firestore document using the REST API."""
         url = FirebaseClient._doc_url(collection, doc_id)
         headers = {"Authorization": f"Bearer {id_token}"}
-        r = requests.get(url, headers=headers, timeout=15)
+        r = _http.get(url, headers=headers, timeout=15)
         if r.status_code == 404:
             return {"error": "NOT_FOUND", "status_code": 404}
         return r.json()
@@ -162,7 +166,7 @@ class FirebaseClient:
         """Delete a Firestore document at /{collection}/{doc_id}."""
         url = FirebaseClient._doc_url(collection, doc_id)
         headers = {"Authorization": f"Bearer {id_token}"}
-        r = requests.delete(url, headers=headers, timeout=15)
+        r = _http.delete(url, headers=headers, timeout=15)
         return r.json()
 
     @staticmethod
@@ -170,7 +174,7 @@ class FirebaseClient:
         """Delete a Firebase Authentication account."""
         url = FirebaseClient._auth_url("accounts:delete")
         payload = {"idToken": id_token}
-        r = requests.post(url, json=payload, timeout=15)
+        r = _http.post(url, json=payload, timeout=15)
         return r.json()
 
     # Convenience wrappers for users collection
@@ -271,6 +275,8 @@ class FirebaseClient:
                 return int(field_data)
             except (ValueError, TypeError):
                 return default_value
+        if field_type == "boolean" and isinstance(field_data, str):
+            return field_data.lower() == "true"
         
         return field_data if field_data else default_value
 
@@ -813,10 +819,9 @@ class FirebaseClient:
     def _get_anonymous_token() -> str:
         """Get an anonymous authentication token for public operations"""
         try:
-            import requests
             url = f"https://identitytoolkit.googleapis.com/v1/accounts:signUp?key={FIREBASE_API_KEY}"
             payload = {"returnSecureToken": True}
-            resp = requests.post(url, json=payload, timeout=10)
+            resp = _http.post(url, json=payload, timeout=10)
             if resp.status_code == 200:
                 data = resp.json()
                 return data.get("idToken", "")
@@ -846,14 +851,12 @@ class FirebaseClient:
             else:
                 # --- Use Firebase REST API with API key for public read access ---
                 try:
-                    import requests
-                    
                     # Since Firestore rules now allow public read access (allow read: if true),
                     # we can use the API key directly without authentication
                     firestore_url = f"https://firestore.googleapis.com/v1/projects/{FIREBASE_PROJECT_ID}/databases/(default)/documents/referral_codes/{referral_code}"
                     params = {"key": FIREBASE_API_KEY}
                     
-                    resp = requests.get(firestore_url, params=params, timeout=10)
+                    resp = _http.get(firestore_url, params=params, timeout=10)
                     debug_log(f"Firestore API response: {resp.status_code}")
                     
                     if resp.status_code == 404:
@@ -950,7 +953,7 @@ class FirebaseClient:
             "idToken": id_token
         }
         try:
-            r = requests.post(url, json=payload, timeout=15)
+            r = _http.post(url, json=payload, timeout=15)
             return r.json()
         except Exception as e:
             return {"error": f"Request failed: {str(e)}"}
@@ -966,7 +969,7 @@ class FirebaseClient:
             url = FirebaseClient._auth_url("accounts:lookup")
             payload = {"idToken": id_token}
             
-            r = requests.post(url, json=payload, timeout=15)
+            r = _http.post(url, json=payload, timeout=15)
             data = r.json()
             
             if "error" in data:
@@ -2,6 +2,7 @@ import os
 import sys
 from pathlib import Path
 
+from PySide6.QtGui import QPixmapCache
 from PySide6.QtWidgets import QApplication, QMainWindow, QTabWidget
 
 from downloaders.instagram import InstagramWidget
@@ -60,6 +61,8 @@ class MainWindow(QMainWindow):
 
 def main() -> None:
 	app = QApplication(sys.argv)
+	# Room for playlist thumbnails in Qt's pixmap cache (limit is in KB)
+	QPixmapCache.setCacheLimit(65536)
 	# Apply a simple, modern stylesheet
 	app.setStyle("Fusion")
 	app.setStyleSheet("""
@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
 
-from PySide6.QtCore import QObject, QThread, QTimer, Signal, Qt
+from PySide6.QtCore import QObject, QThreadPool, QTimer, Signal, Qt
 from PySide6.QtGui import QIcon, QMovie
 from PySide6.QtWidgets import (
 	QWidget,
@@ -58,9 +58,10 @@ class DownloadWidget(QWidget):
 
 		self._progress_state = ProgressState()
 		self._progress_lock = threading.Lock()
-		self._thread: Optional[QThread] = None
+		# Workers run on a pool instead of a QThread each; the pool is our own so
+		# other windows resizing the global pool don't limit this widget
+		self._pool = QThreadPool(self)
 		self._worker: Optional[YtDlpWorker] = None
-		self._fmt_thread: Optional[QThread] = None
 		self._fmt_worker: Optional[YtDlpWorker] = None
 		self._available_formats = []
 		self._available_heights = []
@@ -153,10 +154,11 @@ class DownloadWidget(QWidget):
 		root.addLayout(self._actions_row)
 
 	def _setup_timer(self) -> None:
+		# Polls the download worker's latest progress snapshot; only runs while
+		# a download is in flight (started in _start_worker)
 		self.timer = QTimer(self)
-		self.timer.setInterval(500)  # 0.5 sec
+		self.timer.setInterval(60)
 		self.timer.timeout.connect(self._refresh_progress_ui)
-		self.timer.start()
 
 	def _on_load_formats(self) -> None:
 		url = self.url_edit.text().strip()
@@ -206,25 +208,21 @@ class DownloadWidget(QWidget):
 		self.cancel_btn.setEnabled(False)
 
 	def _start_worker(self, url: str, out_dir: str, format_selector: Optional[str]) -> None:
-		self._thread = QThread(self)
 		self._worker = YtDlpWorker(
 			url=url,
 			out_dir=out_dir,
 			ffmpeg_location=self.ffmpeg_location,
 		)
-		self._worker.moveToThread(self._thread)
-		self._thread.started.connect(self._worker.run)
-		self._worker.sig_progress.connect(self._on_worker_progress)
 		self._worker.sig_error.connect(self._on_worker_error)
 		self._worker.sig_finished.connect(self._on_worker_finished)
-		# Real-time progress: update immediately on signal as well
-		self._worker.sig_progress.connect(lambda p, s, e, st: self._refresh_progress_ui_immediate(p, s, e, st))
+		self._worker.sig_done.connect(lambda w=self._worker: self._release_worker(w))
 		# Configure desired format by setting attributes on worker (read inside run)
 		setattr(self._worker, "_desired_format", format_selector)
 		setattr(self._worker, "_desired_audio", self.type_combo.currentIndex() == 1)
 		setattr(self._worker, "_desired_mp3_bitrate", self._selected_mp3_bitrate())
 
-		self._thread.start()
+		self._pool.start(self._worker.run)
+		self.timer.start()
 
 	def _on_worker_progress(self, percent: float, speed: str, eta: str, status: str) -> None:
 		with self._progress_lock:
@@ -234,13 +232,14 @@ class DownloadWidget(QWidget):
 			self._progress_state.status = status
 
 	def _on_worker_error(self, message: str) -> None:
+		self.timer.stop()
 		with self._progress_lock:
 			self._progress_state.status = f"Error: {message}"
 		self.download_btn.setEnabled(True)
 		self.cancel_btn.setEnabled(False)
-		self._cleanup_thread()
 
 	def _on_worker_finished(self) -> None:
+		self.timer.stop()
 		with self._progress_lock:
 			self._progress_state.percent = 100.0
 			self._progress_state.status = "Completed"
@@ -251,27 +250,20 @@ class DownloadWidget(QWidget):
 		# After a short visual completion, reset progress bar to 0
 		self.progress.setValue(100)
 		QTimer.singleShot(400, lambda: (self.progress.setValue(0), None))
-		self._cleanup_thread()
 
-	def _cleanup_thread(self) -> None:
-		if self._worker is not None:
-			self._worker.deleteLater()
+	def _release_worker(self, worker: YtDlpWorker) -> None:
+		# Runs on sig_done, i.e. once the worker's pool task has returned, so
+		# only that worker is dropped and nothing still running is deleted
+		if self._worker is worker:
 			self._worker = None
-		if self._thread is not None:
-			self._thread.quit()
-			self._thread.wait()
-			self._thread.deleteLater()
-			self._thread = None
-		if self._fmt_worker is not None:
-			self._fmt_worker.deleteLater()
+		elif self._fmt_worker is worker:
 			self._fmt_worker = None
-		if self._fmt_thread is not None:
-			self._fmt_thread.quit()
-			self._fmt_thread.wait()
-			self._fmt_thread.deleteLater()
-			self._fmt_thread = None
+		worker.deleteLater()
 
 	def _refresh_progress_ui(self) -> None:
+		latest = self._worker.latest() if self._worker is not None else None
+		if latest is not None:
+			self._on_worker_progress(*latest)
 		with self._progress_lock:
 			ps = ProgressState(
 				percent=self._progress_state.percent,
@@ -282,19 +274,12 @@ class DownloadWidget(QWidget):
 		self.progress.setValue(int(ps.percent))
 		# No textual status under progress bar per request
 
-	def _refresh_progress_ui_immediate(self, percent: float, speed: str, eta: str, status: str) -> None:
-		# Update UI immediately on progress signal
-		self.progress.setValue(int(percent))
-		# No textual status under progress bar per request
-
 	def _start_formats_worker(self, url: str) -> None:
-		self._fmt_thread = QThread(self)
 		self._fmt_worker = YtDlpWorker(url=url, out_dir=str(get_default_desktop()), ffmpeg_location=self.ffmpeg_location)
-		self._fmt_worker.moveToThread(self._fmt_thread)
-		self._fmt_thread.started.connect(self._fmt_worker.fetch_formats)
 		self._fmt_worker.sig_formats.connect(self._on_formats_ready)
 		self._fmt_worker.sig_error.connect(self._on_formats_error)
-		self._fmt_thread.start()
+		self._fmt_worker.sig_done.connect(lambda w=self._fmt_worker: self._release_worker(w))
+		self._pool.start(self._fmt_worker.fetch_formats)
 
 	def _on_formats_ready(self, fmts: list, media_kind: str) -> None:
 		self._available_formats = fmts or []
@@ -422,7 +407,6 @@ class DownloadWidget(QWidget):
 		# Hide spinner and keep UI interactive
 		self._hide_loading_popup()
 		# No textual status under progress bar
-		self._cleanup_thread()
 
 	def _is_url_allowed(self, url: str) -> bool:
 		if not self.allowed_hosts:
@@ -0,0 +1,24 @@
+"""Process-wide network access shared by the downloader GUIs."""
+import os
+from typing import Optional
+
+from PySide6.QtCore import QStandardPaths
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkDiskCache
+
+
+_network_manager: Optional[QNetworkAccessManager] = None
+
+
+def shared_network_manager() -> QNetworkAccessManager:
+    # One manager per process so every thumbnail request, from any downloader
+    # window, reuses the same connection pool (keep-alive / HTTP2) and a
+    # single on-disk cache with one size budget.
+    global _network_manager
+    if _network_manager is None:
+        _network_manager = QNetworkAccessManager()
+        disk_cache = QNetworkDiskCache(_network_manager)
+        cache_root = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+        disk_cache.setCacheDirectory(os.path.join(cache_root, 'thumbnails'))
+        disk_cache.setMaximumCacheSize(50 * 1024 * 1024)
+        _network_manager.setCache(disk_cache)
+    return _network_manager
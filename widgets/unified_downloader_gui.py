@@ -1,9 +1,9 @@
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QLineEdit, QPushButton, QLabel,
+    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPlainTextEdit, QLineEdit, QPushButton, QLabel,
     QProgressBar, QComboBox, QSpinBox, QFileDialog, QGroupBox, QRadioButton,
     QButtonGroup, QScrollArea, QFrame, QCheckBox
 )
-from PySide6.QtCore import Qt, Signal, QObject, QThreadPool, QTimer, QRunnable
+from PySide6.QtCore import Qt, Signal, QObject, QThread, QThreadPool, QTimer, QRunnable, QStringListModel
 from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 from PySide6.QtGui import QPixmap
 from PySide6.QtCore import Qt, Signal, QObject, QThreadPool, QTimer, QRunnable
@@ -11,8 +11,10 @@ from PySide6.QtGui import QFont, QPixmap
 from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 from datetime import datetime
 import os
+import re
 import time
-from typing import Optional, List
+from collections import defaultdict
+from typing import Callable, Dict, Optional, List, Set, Union
 
 from downloader_core import (
     parse_multiple_urls_for_hosts,
@@ -20,6 +22,15 @@ from downloader_core import (
     fetch_generic_playlist_info,
     download_single_video_with_progress,
 )
+from widgets.network import shared_network_manager
+
+
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+_mono = time.monotonic
+
+
+def _strip_ansi(text: str) -> str:
+    return _ANSI_RE.sub('', text) if '\x1b' in text else text
 
 
 class _ThumbnailCache:
@@ -32,23 +43,39 @@ class _ThumbnailCache:
 
 
 class _ThumbnailLoader(QObject):
-    thumbnail_loaded = Signal(str, QPixmap)
     def __init__(self, cache: _ThumbnailCache):
         super().__init__()
         self.cache = cache
-        self.network_manager = QNetworkAccessManager()
-    def load_thumbnail(self, video_id: str, url: str):
+        self.network_manager = shared_network_manager()
+        # url -> video ids waiting on the same in-flight request
+        self._waiters: dict[str, list[str]] = {}
+        # video id -> labels to receive the pixmap, so delivery is a dict
+        # lookup rather than a signal fanned out to every row
+        self._targets: dict[str, list[QLabel]] = {}
+    def load_thumbnail(self, video_id: str, url: str, label: QLabel):
         cached = self.cache.get(url)
         if cached:
-            self.thumbnail_loaded.emit(video_id, cached)
+            label.setPixmap(cached)
             return
+        self._targets.setdefault(video_id, []).append(label)
+        if url in self._waiters:
+            self._waiters[url].append(video_id)
+            return
+        self._waiters[url] = [video_id]
         try:
             request = QNetworkRequest(url)
+            request.setAttribute(QNetworkRequest.Attribute.Http2AllowedAttribute, True)
+            request.setAttribute(QNetworkRequest.Attribute.CacheLoadControlAttribute, QNetworkRequest.CacheLoadControl.PreferCache)
+            request.setRawHeader(b"Connection", b"keep-alive")
             reply = self.network_manager.get(request)
-            reply.finished.connect(lambda: self._on_downloaded(video_id, url, reply))
+            reply.finished.connect(lambda: self._on_downloaded(url, reply))
         except Exception:
-            pass
-    def _on_downloaded(self, video_id: str, url: str, reply: QNetworkReply):
+            for video_id in self._waiters.pop(url, []):
+                self._targets.pop(video_id, None)
+    def _on_downloaded(self, url: str, reply: QNetworkReply):
+        video_ids = self._waiters.pop(url, [])
+        # Always release the waiting labels, whether or not a pixmap arrives
+        labels = [label for video_id in video_ids for label in self._targets.pop(video_id, [])]
         if reply.error() == QNetworkReply.NetworkError.NoError:
             data = reply.readAll()
             pixmap = QPixmap()
@@ -56,8 +83,29 @@ class _ThumbnailLoader(QObject):
             if not pixmap.isNull():
                 scaled = pixmap.scaled(120, 68, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
                 self.cache.set(url, scaled)
-                self.thumbnail_loaded.emit(video_id, scaled)
+                for label in labels:
+                    try:
+                        label.setPixmap(scaled)
+                    except RuntimeError:
+                        # label's widget was destroyed while loading
+                        pass
         reply.deleteLater()
+    def forget(self, video_id: str, label: QLabel):
+        """Stop delivering a pending thumbnail to ``label``."""
+        labels = self._targets.get(video_id)
+        if labels and label in labels:
+            labels.remove(label)
+
+
+_thumbnail_loader: Optional[_ThumbnailLoader] = None
+
+
+def _shared_thumbnail_loader() -> _ThumbnailLoader:
+    # Shared by every downloader tab so cache hits carry across platforms.
+    global _thumbnail_loader
+    if _thumbnail_loader is None:
+        _thumbnail_loader = _ThumbnailLoader(_ThumbnailCache())
+    return _thumbnail_loader
 
 
 class _WorkerRunnable(QRunnable):
@@ -65,44 +113,83 @@ class _WorkerRunnable(QRunnable):
         super().__init__()
         self.worker = worker
     def run(self):
+        run_method = getattr(self.worker, "run", None)
+        if run_method is None:
+            return
         try:
-            if hasattr(self.worker, "run"):
-                getattr(self.worker, "run")()
+            run_method()
         except Exception:
-            try:
-                if hasattr(self.worker, "error_occurred"):
-                    if hasattr(self.worker, 'error_occurred'):
-                        getattr(self.worker, 'error_occurred').emit("Worker error")
-            except Exception:
-                pass
+            sig = getattr(self.worker, "error_occurred", None)
+            if sig is not None:
+                try:
+                    sig.emit("Worker error")
+                except Exception:
+                    pass
+
+
+class _ParseWorker(QObject):
+    parsed = Signal(list)
+    error_occurred = Signal(str)
+    def __init__(self, text: str, allowed_hosts: List[str]):
+        super().__init__()
+        self.text = text
+        self.allowed_hosts = allowed_hosts
+    def run(self):
+        try:
+            urls = parse_multiple_urls_for_hosts(self.text, self.allowed_hosts)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+            return
+        self.parsed.emit(urls)
+
+
+class _InfoWorker(QObject):
+    sig_ok = Signal(dict)
+    sig_err = Signal(str)
+    def __init__(self, u: str, ao: bool):
+        super().__init__()
+        self.u = u
+        self.ao = ao
+    def run(self):
+        try:
+            info = fetch_generic_info(self.u, self.ao)
+            if info.get('type') in ('playlist', 'channel', 'playlist_channel'):
+                info = fetch_generic_playlist_info(self.u, self.ao)
+            self.sig_ok.emit(info)
+        except Exception as e:
+            self.sig_err.emit(str(e))
 
 
 class _VideoItem(QWidget):
+    # Quality lists shared by every row; swapping models on a format change
+    # avoids clear()/addItems() churn. Created on first use.
+    _MP3_MODEL: Optional[QStringListModel] = None
+    _IMG_MODEL: Optional[QStringListModel] = None
     def __init__(self, video_data: dict, loader: _ThumbnailLoader):
         super().__init__()
-        self.data = video_data
+        if _VideoItem._MP3_MODEL is None:
+            _VideoItem._MP3_MODEL = QStringListModel(['320 kbps', '192 kbps', '128 kbps', 'Best Audio'])
+            _VideoItem._IMG_MODEL = QStringListModel(['Original'])
+        self.loader = loader
         row = QHBoxLayout(self)
         row.setContentsMargins(5, 5, 5, 5)
         self.chk = QCheckBox()
-        self.chk.setChecked(True)
         row.addWidget(self.chk)
         self.thumb = QLabel()
         self.thumb.setFixedSize(120, 68)
         self.thumb.setStyleSheet("border: 1px solid #ccc; background: #f0f0f0;")
-        self.thumb.setScaledContents(True)
+        # Pixmaps arrive pre-scaled to fit 120x68; no per-paint rescale
+        self.thumb.setAlignment(Qt.AlignmentFlag.AlignCenter)
         row.addWidget(self.thumb)
-        if video_data.get('thumbnail_url'):
-            loader.thumbnail_loaded.connect(self._on_thumb)
-            loader.load_thumbnail(video_data['id'], video_data['thumbnail_url'])
+        self.data = None
         info = QVBoxLayout()
-        title = QLabel(video_data.get('title', 'Unknown'))
-        title.setWordWrap(True)
-        title.setStyleSheet("font-weight: bold;")
-        info.addWidget(title)
-        if video_data.get('duration'):
-            d = QLabel(f"Duration: {video_data['duration']}")
-            d.setStyleSheet("color: #666; font-size: 11px;")
-            info.addWidget(d)
+        self.title_label = QLabel()
+        self.title_label.setWordWrap(True)
+        self.title_label.setStyleSheet("font-weight: bold;")
+        info.addWidget(self.title_label)
+        self.duration_label = QLabel()
+        self.duration_label.setStyleSheet("color: #666; font-size: 11px;")
+        info.addWidget(self.duration_label)
         
         # Add format selection radio buttons
         format_layout = QHBoxLayout()
@@ -114,7 +201,6 @@ class _VideoItem(QWidget):
         self.format_group.addButton(self.mp4_radio, 0)
         self.format_group.addButton(self.mp3_radio, 1)
         self.format_group.addButton(self.image_radio, 2)
-        self.mp4_radio.setChecked(True)  # Default to MP4
         format_layout.addWidget(self.mp4_radio)
         format_layout.addWidget(self.mp3_radio)
         format_layout.addWidget(self.image_radio)
@@ -126,25 +212,45 @@ class _VideoItem(QWidget):
         self.quality_label = QLabel("Quality:")
         row.addWidget(self.quality_label)
         self.quality = QComboBox()
-        self.quality.addItems(video_data.get('qualities', ['Best Available']))
         self.quality.setMaximumWidth(150)
+        self._mp4_model = QStringListModel(self)
         row.addWidget(self.quality)
         
-        if video_data.get('subtitles'):
-            row.addWidget(QLabel("Subtitles:"))
-            self.subtitle = QComboBox()
-            self.subtitle.addItem("None")
-            self.subtitle.addItems(video_data['subtitles'])
-            self.subtitle.setMaximumWidth(100)
-            row.addWidget(self.subtitle)
-        else:
-            self.subtitle = None
+        self.subtitle_label = QLabel("Subtitles:")
+        row.addWidget(self.subtitle_label)
+        self._subtitle_combo = QComboBox()
+        self._subtitle_combo.setMaximumWidth(100)
+        row.addWidget(self._subtitle_combo)
         
         # Connect radio buttons to update quality options
         self.format_group.buttonClicked.connect(self._on_format_changed)
-    def _on_thumb(self, vid: str, pm: QPixmap):
-        if vid == self.data['id']:
-            self.thumb.setPixmap(pm)
+        self.set_data(video_data)
+    def set_data(self, video_data: dict):
+        """(Re)configure the row for a media entry; used when recycling rows."""
+        if self.data is not None:
+            self.loader.forget(self.data['id'], self.thumb)
+        self.data = video_data
+        self.chk.setChecked(True)
+        self.thumb.clear()
+        self.title_label.setText(video_data.get('title', 'Unknown'))
+        self.duration_label.setText(f"Duration: {video_data.get('duration')}")
+        self.duration_label.setVisible(bool(video_data.get('duration')))
+        self.mp4_radio.setChecked(True)  # Default to MP4
+        self.quality_label.setText("Quality:")
+        self._mp4_model.setStringList(video_data.get('qualities', ['Best Available']))
+        self.quality.setModel(self._mp4_model)
+        self.quality.setCurrentIndex(0)
+        self._subtitle_combo.clear()
+        if video_data.get('subtitles'):
+            self._subtitle_combo.addItem("None")
+            self._subtitle_combo.addItems(video_data['subtitles'])
+            self.subtitle = self._subtitle_combo
+        else:
+            self.subtitle = None
+        self.subtitle_label.setVisible(self.subtitle is not None)
+        self._subtitle_combo.setVisible(self.subtitle is not None)
+        if video_data.get('thumbnail_url'):
+            self.loader.load_thumbnail(video_data['id'], video_data['thumbnail_url'], self.thumb)
     def is_selected(self) -> bool:
         return self.chk.isChecked()
     def selected_quality(self) -> Optional[str]:
@@ -163,17 +269,13 @@ class _VideoItem(QWidget):
         """Update quality options based on selected format"""
         if self.mp3_radio.isChecked():
             # Update to MP3 qualities
-            self.quality.clear()
-            self.quality.addItems(['320 kbps', '192 kbps', '128 kbps', 'Best Audio'])
+            self.quality.setModel(_VideoItem._MP3_MODEL)
         elif self.mp4_radio.isChecked():
             # Update to MP4 qualities
-            self.quality.clear()
-            qualities = self.data.get('qualities', ['Best Available'])
-            self.quality.addItems(qualities)
+            self.quality.setModel(self._mp4_model)
         elif self.image_radio.isChecked():
             # For images, we don't need quality selection
-            self.quality.clear()
-            self.quality.addItems(['Original'])
+            self.quality.setModel(_VideoItem._IMG_MODEL)
             
         # Update quality label
         if self.image_radio.isChecked():
@@ -211,6 +313,13 @@ class _DownloadItem(QWidget):
         self.status = QLabel("Waiting...")
         self.status.setStyleSheet("color: #666; font-size: 10px;")
         v.addWidget(self.status)
+    def reset(self, title: str, item_id: str):
+        """Reuse this widget for a new queue entry."""
+        self.item_id = item_id
+        self.title.setText(title)
+        self.bar.setValue(0)
+        self.percent_text.setText("0%")
+        self.set_queued()
     def set_queued(self):
         self.status_icon.setText("⏳")
         self.status.setText("Queued...")
@@ -247,9 +356,12 @@ class _DownloadWorker(QObject):
         self._running = True
         self._paused = False
         self.last_progress_update = 0.0
+        # Latest (percent, status) from the hook; polled by the GUI timer
+        self._latest_progress = None
     def run(self):
         if not self._running:
             return
+        mono = _mono
         def hook(d):
             if not self._running:
                 raise Exception("Cancelled")
@@ -257,24 +369,27 @@ class _DownloadWorker(QObject):
                 if not self._running:
                     raise Exception("Cancelled")
                 time.sleep(0.1)
-            status = d.get('status', '')
+            d_get = d.get
+            status = d_get('status', '')
             if status == 'downloading':
-                import re
-                percent_raw = d.get('_percent_str', '0%')
-                percent = re.sub(r'\x1b\[[0-9;]*m', '', percent_raw).replace('%', '').strip()
+                percent_raw = d_get('_percent_str', '0%')
+                percent = _strip_ansi(percent_raw).replace('%', '').strip()
                 try:
                     p = float(percent)
                 except Exception:
                     p = 0.0
-                speed_raw = d.get('_speed_str', 'N/A')
-                eta_raw = d.get('_eta_str', 'N/A')
-                speed = re.sub(r'\x1b\[[0-9;]*m', '', speed_raw) if speed_raw != 'N/A' else 'N/A'
-                eta = re.sub(r'\x1b\[[0-9;]*m', '', eta_raw) if eta_raw != 'N/A' else 'N/A'
+                speed_raw = d_get('_speed_str', 'N/A')
+                eta_raw = d_get('_eta_str', 'N/A')
+                speed = _strip_ansi(speed_raw) if speed_raw != 'N/A' else 'N/A'
+                eta = _strip_ansi(eta_raw) if eta_raw != 'N/A' else 'N/A'
                 txt = f"Downloading - {speed} | ETA: {eta}"
-                self.progress.emit(self.item_id, p, txt)
-                now = time.time()
+                self._latest_progress = (p, txt)
+                now = mono()
                 if now - self.last_progress_update >= 0.5:
-                    self.progress_display.emit(self.item_id, os.path.basename(d.get('filename','') or 'file'), p, speed, eta, f"[download] {p:.1f}%")
+                    # Only build the console payload when it is actually emitted
+                    filename = os.path.basename(d_get('filename', '') or 'file')
+                    msg = f"[download] {p:.1f}%"
+                    self.progress_display.emit(self.item_id, filename, p, speed, eta, msg)
                     self.last_progress_update = now
         try:
             result = download_single_video_with_progress(
@@ -286,25 +401,45 @@ class _DownloadWorker(QObject):
             self.finished.emit(self.item_id, result)
         except Exception as e:
             self.finished.emit(self.item_id, {'success': False, 'message': str(e)})
-    def pause(self): self._paused = True
+    def pause(self):
+        self._paused = True
     def resume(self): self._paused = False
     def stop(self): self._running = False
 
 
 class UnifiedDownloaderGUI(QWidget):
+    # Media rows are built in batches as the selection list is scrolled
+    _ROW_BATCH = 50
+
     def __init__(self, title: str, allowed_hosts: Optional[List[str]] = None, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self.title = title
         self.allowed_hosts = allowed_hosts or []
-        self.thread_pool = QThreadPool.globalInstance()
-        self.thread_pool.setMaxThreadCount(2)
-        self.thumbnail_cache = _ThumbnailCache()
-        self.thumbnail_loader = _ThumbnailLoader(self.thumbnail_cache)
+        # Dedicated pools so downloads and info fetches don't throttle each
+        # other (or anything else on the global pool).
+        self.max_concurrent_downloads = 1
+        self.download_pool = QThreadPool(self)
+        self.download_pool.setMaxThreadCount(self.max_concurrent_downloads)
+        # Keep the (few) download threads alive between batches so queued
+        # items are streamed onto the same threads rather than new ones
+        self.download_pool.setExpiryTimeout(-1)
+        self.info_pool = QThreadPool(self)
+        self.info_pool.setMaxThreadCount(min(8, QThread.idealThreadCount()))
+        self.thumbnail_loader = _shared_thumbnail_loader()
+        self.thumbnail_cache = self.thumbnail_loader.cache
         self.download_widgets = {}
+        # Download row ids bucketed by status, so pause/resume only touch
+        # the rows that need it instead of scanning every widget's icon
+        self._widgets_by_status: Dict[str, Set[str]] = defaultdict(set)
+        self._widget_status: Dict[str, str] = {}
         self.video_items = []
-        self.fetched_videos = []
+        self.fetched_by_id = {}
+        # Hidden rows kept around for reuse on the next fetch / download run
+        self._video_item_pool: list[_VideoItem] = []
+        # Fetched entries that don't have a row widget yet
+        self._unrealized: list[dict] = []
+        self._item_pool: list[_DownloadItem] = []
         self.download_queue = []
-        self.max_concurrent_downloads = 1
         self.current_downloads = 0
         self.active_downloads = 0
         self.completed_downloads = 0
@@ -312,7 +447,15 @@ class UnifiedDownloaderGUI(QWidget):
         self.output_directory = os.path.join(os.getcwd(), 'downloads')
         self.is_paused = False
         self.workers = {}
+        # Snapshot last applied to each row; the worker's slot is never cleared
+        # from the GUI side, so a newer write can't be lost in between
+        self._applied_progress: Dict[str, tuple] = {}
+        self._parse_worker = None
         self.selected_format = 'mp4'  # Default to MP4
+        # Console lines waiting to be flushed by the progress timer
+        self._log_buffer: list[str] = []
+        # Per-item queue chatter is only formatted when this is on
+        self._log_verbose = False
         self.progress_timer = QTimer(self)
         self.progress_timer.setInterval(100)
         self.progress_timer.timeout.connect(self._update_progress_bars)
@@ -387,6 +530,7 @@ class UnifiedDownloaderGUI(QWidget):
         self.video_list_layout = QVBoxLayout(self.video_list_widget)
         self.video_list_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         self.video_scroll_area.setWidget(self.video_list_widget)
+        self.video_scroll_area.verticalScrollBar().valueChanged.connect(self._on_video_scroll)
         v_v.addWidget(self.video_scroll_area)
         self.video_list_group.setVisible(False)
         root.addWidget(self.video_list_group)
@@ -405,20 +549,26 @@ class UnifiedDownloaderGUI(QWidget):
         workers_row = QHBoxLayout()
         workers_row.addWidget(QLabel("Concurrent Downloads:"))
         self.workers_spinbox = QSpinBox()
-        self.workers_spinbox.setRange(1, 2)
+        self.workers_spinbox.setRange(1, 8)
         self.workers_spinbox.setValue(1)
         self.workers_spinbox.valueChanged.connect(self._update_max_concurrent)
         workers_row.addWidget(self.workers_spinbox)
+        self.verbose_chk = QCheckBox("Verbose log")
+        self.verbose_chk.toggled.connect(self._set_log_verbose)
+        workers_row.addWidget(self.verbose_chk)
         workers_row.addStretch()
         s_v.addLayout(workers_row)
         root.addWidget(settings)
         # Progress console
         progress_group = QGroupBox("Download Progress")
         p_v = QVBoxLayout(progress_group)
-        self.progress_output = QTextEdit()
+        self.progress_output = QPlainTextEdit()
         self.progress_output.setReadOnly(True)
         self.progress_output.setMaximumHeight(120)
-        self.progress_output.setStyleSheet("QTextEdit { background:#0d1117; color:#58a6ff; font-family:Consolas,monospace; font-size:11px; }")
+        # Keep a rolling window; Qt drops the oldest blocks past the limit
+        self.progress_output.setMaximumBlockCount(2000)
+        self.progress_output.setStyleSheet("QPlainTextEdit { background:#0d1117; color:#58a6ff; font-family:Consolas,monospace; font-size:11px; }")
+        self._log_scroll = self.progress_output.verticalScrollBar()
         p_v.addWidget(self.progress_output)
         root.addWidget(progress_group)
         # Buttons
@@ -461,11 +611,34 @@ class UnifiedDownloaderGUI(QWidget):
 
     def _log(self, message: str):
         ts = datetime.now().strftime("%H:%M:%S")
-        self.progress_output.append(f"[{ts}] {message}")
-        self.progress_output.verticalScrollBar().setValue(self.progress_output.verticalScrollBar().maximum())
+        self._log_buffer.append(f"[{ts}] {message}")
+
+    def _log_debug(self, message: Union[str, Callable[[], str]]):
+        """Log queue chatter; a callable is only formatted when verbose."""
+        if not self._log_verbose:
+            return
+        self._log(message() if callable(message) else message)
+
+    def _set_log_verbose(self, enabled: bool):
+        self._log_verbose = enabled
+
+    def _flush_log(self):
+        if not self._log_buffer:
+            return
+        text = '\n'.join(self._log_buffer)
+        self._log_buffer.clear()
+        self.progress_output.appendPlainText(text)
+        sb = self._log_scroll
+        sb.setValue(sb.maximum())
 
     def _toggle_format(self, format_type: str):
         """Toggle between MP4, MP3, and image download formats"""
+        if format_type == self.selected_format:
+            # Re-clicking the active toggle unchecks it; restore and skip the update
+            self.mp4_toggle.setChecked(format_type == 'mp4')
+            self.mp3_toggle.setChecked(format_type == 'mp3')
+            self.image_toggle.setChecked(format_type == 'image')
+            return
         self.selected_format = format_type
         
         # Update button states
@@ -483,8 +656,17 @@ class UnifiedDownloaderGUI(QWidget):
         self._log(f"Switched to {format_type.upper()} format")
 
     def _toggle_select_all(self, state):
-        for it in self.video_items:
-            it.chk.setChecked(state == Qt.CheckState.Checked)
+        # Bulk update: one repaint for the list instead of one per row
+        self.video_list_widget.setUpdatesEnabled(False)
+        try:
+            checked = state == Qt.CheckState.Checked
+            for it in self.video_items:
+                it.chk.blockSignals(True)
+                it.chk.setChecked(checked)
+                it.chk.blockSignals(False)
+        finally:
+            self.video_list_widget.setUpdatesEnabled(True)
+            self.video_list_widget.update()
 
     def _browse_dir(self):
         directory = QFileDialog.getExistingDirectory(self, "Select Output Directory", self.output_directory)
@@ -494,8 +676,11 @@ class UnifiedDownloaderGUI(QWidget):
 
     def _update_max_concurrent(self, value: int):
         self.max_concurrent_downloads = value
-        self.thread_pool.setMaxThreadCount(value)
+        self.download_pool.setMaxThreadCount(value)
         self._log(f"🔧 Max concurrent downloads set to: {value}")
+        if self.download_queue:
+            # A raised limit takes effect now rather than on the next finish
+            self._fill_slots()
 
     def _fetch_info(self):
         text = self.url_input.toPlainText().strip()
@@ -504,90 +689,83 @@ class UnifiedDownloaderGUI(QWidget):
             return
         self.fetch_btn.setEnabled(False)
         self.fetch_btn.setText("⏳ Fetching...")
-        urls = parse_multiple_urls_for_hosts(text, self.allowed_hosts)
+        # Parse on the pool so large pasted lists don't block the GUI thread
+        self._parse_worker = _ParseWorker(text, self.allowed_hosts)
+        self._parse_worker.parsed.connect(self._on_urls_parsed)
+        self._parse_worker.error_occurred.connect(self._on_parse_error)
+        self.info_pool.start(_WorkerRunnable(self._parse_worker))
+
+    def _on_parse_error(self, err: str):
+        self._log(f"❌ Error: {err}")
+        self.fetch_btn.setEnabled(True)
+        self.fetch_btn.setText("🔍 Fetch Info")
+
+    def _on_urls_parsed(self, urls: list):
+        self._parse_worker = None
         if not urls:
             self._log("❌ Error: No valid URLs found for this platform!")
             self.fetch_btn.setEnabled(True)
             self.fetch_btn.setText("🔍 Fetch Info")
             return
         # clear list
-        while self.video_list_layout.count():
-            item = self.video_list_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        self.video_items.clear()
-        self.fetched_videos.clear()
+        self._release_video_items()
+        self.fetched_by_id.clear()
         # Fetch all formats by default
         audio_only = False
-        fetch_all = True
-        fetch_images = True
-        # fetch in background threads pool (simple loop here)
-        class _InfoWorker(QObject):
-            sig_ok = Signal(dict)
-            sig_err = Signal(str)
-            def __init__(self, u: str, ao: bool):
-                super().__init__()
-                self.u = u
-                self.ao = ao
-            def run(self):
-                try:
-                    # For "all" or "image" format types, we need to fetch all available formats
-                    info = fetch_generic_info(self.u, self.ao)
-                    # Add image information if needed
-                    if fetch_all or fetch_images:
-                        # We'll modify the info to include image data
-                        pass
-                    if info.get('type') in ('playlist', 'channel', 'playlist_channel'):
-                        info = fetch_generic_playlist_info(self.u, self.ao)
-                    self.sig_ok.emit(info)
-                except Exception as e:
-                    self.sig_err.emit(str(e))
         self._pending = len(urls)
-        def _on_ok(info: dict):
-            if info.get('type') == 'video':
-                row = _VideoItem(info, self.thumbnail_loader)
-                self.video_list_layout.addWidget(row)
-                self.video_items.append(row)
-                self.fetched_videos.append(info)
-                self._log(f"✅ Fetched: {info.get('title','Unknown')}")
-            else:
-                videos = info.get('videos', [])
-                self._log(f"✅ Fetched collection: {info.get('title','Unknown')} ({len(videos)} items)")
-                for v in videos:
-                    row = _VideoItem(v, self.thumbnail_loader)
-                    self.video_list_layout.addWidget(row)
-                    self.video_items.append(row)
-                    self.fetched_videos.append(v)
-            self._pending -= 1
-            if self._pending == 0:
-                self.video_list_group.setVisible(True)
-                self.fetch_btn.setEnabled(True)
-                self.fetch_btn.setText("🔍 Fetch Info")
-        def _on_err(err: str):
-            self._log(f"❌ Fetch error: {err}")
-            self._pending -= 1
-            if self._pending == 0:
-                self.video_list_group.setVisible(True)
-                self.fetch_btn.setEnabled(True)
-                self.fetch_btn.setText("🔍 Fetch Info")
         for u in urls:
             w = _InfoWorker(u, audio_only)
-            w.sig_ok.connect(_on_ok)
-            w.sig_err.connect(_on_err)
-            self.thread_pool.start(_WorkerRunnable(w))
+            w.sig_ok.connect(self._on_info_ok)
+            w.sig_err.connect(self._on_info_err)
+            self.info_pool.start(_WorkerRunnable(w))
+
+    def _on_info_ok(self, info: dict):
+        if info.get('type') == 'video':
+            self._unrealized.append(info)
+            self.fetched_by_id[info['id']] = info
+            self._log(f"✅ Fetched: {info.get('title','Unknown')}")
+        else:
+            videos = info.get('videos', [])
+            self._log(f"✅ Fetched collection: {info.get('title','Unknown')} ({len(videos)} items)")
+            self._unrealized.extend(videos)
+            for v in videos:
+                self.fetched_by_id[v['id']] = v
+        if len(self.video_items) < self._ROW_BATCH:
+            self._realize_rows(self._ROW_BATCH - len(self.video_items))
+        self._pending -= 1
+        if self._pending == 0:
+            self.video_list_group.setVisible(True)
+            self.fetch_btn.setEnabled(True)
+            self.fetch_btn.setText("🔍 Fetch Info")
+
+    def _on_info_err(self, err: str):
+        self._log(f"❌ Fetch error: {err}")
+        self._pending -= 1
+        if self._pending == 0:
+            self.video_list_group.setVisible(True)
+            self.fetch_btn.setEnabled(True)
+            self.fetch_btn.setText("🔍 Fetch Info")
 
     def _start_download(self):
-        if not self.fetched_videos:
+        if not self.fetched_by_id:
             self._log("❌ Please fetch media info first!")
             return
         selected = []
-        for i, widget in enumerate(self.video_items):
+        for widget in self.video_items:
             if widget.is_selected():
-                vd = self.fetched_videos[i].copy()
+                vd = widget.data.copy()
                 vd['selected_quality'] = widget.selected_quality()
                 vd['selected_subtitle'] = widget.selected_subtitle()
                 vd['selected_format'] = widget.selected_format()  # Add selected format
                 selected.append(vd)
+        if self.chk_all.isChecked():
+            # Rows never scrolled into view keep their default choices
+            for entry in self._unrealized:
+                vd = entry.copy()
+                vd['selected_quality'] = (entry.get('qualities') or ['Best Available'])[0]
+                vd['selected_subtitle'] = None
+                vd['selected_format'] = 'mp4'
+                selected.append(vd)
         if not selected:
             self._log("❌ No media selected!")
             return
@@ -600,12 +778,9 @@ class UnifiedDownloaderGUI(QWidget):
         self.fetch_btn.setEnabled(False)
         self.video_list_group.setVisible(False)
         # clear current list
-        while self.download_items_layout.count():
-            item = self.download_items_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        self.download_widgets.clear()
+        self._release_download_items()
         self.workers.clear()
+        self._applied_progress.clear()
         self.download_queue.clear()
         self.active_downloads = len(selected)
         self.completed_downloads = 0
@@ -614,41 +789,110 @@ class UnifiedDownloaderGUI(QWidget):
         self._refresh_stats()
         for v in selected:
             item_id = v['id']
-            w = _DownloadItem(v.get('title','Unknown'), item_id)
-            self.download_items_layout.addWidget(w)
+            w = self._acquire_download_item(v.get('title','Unknown'), item_id)
             self.download_widgets[item_id] = w
-            w.set_queued()
+            self._set_widget_status(item_id, "queued")
             self.download_queue.append({'item_id': item_id, 'video': v, 'widget': w})
         self._log(f"📋 Queue created with {len(self.download_queue)} items")
         self._log(f"🔧 Max concurrent downloads: {self.max_concurrent_downloads}")
-        self._start_next()
+        self._fill_slots()
+
+    def _acquire_video_item(self, video_data: dict) -> _VideoItem:
+        if self._video_item_pool:
+            row = self._video_item_pool.pop()
+            row.set_data(video_data)
+            self.video_list_layout.removeWidget(row)
+        else:
+            row = _VideoItem(video_data, self.thumbnail_loader)
+        self.video_list_layout.addWidget(row)
+        row.show()
+        return row
+
+    def _release_video_items(self):
+        for row in self.video_items:
+            row.hide()
+            self._video_item_pool.append(row)
+        self.video_items.clear()
+        self._unrealized.clear()
 
-    def _start_next(self):
+    def _realize_rows(self, count: int):
+        """Build row widgets for the next ``count`` fetched entries."""
+        batch = self._unrealized[:count]
+        if not batch:
+            return
+        del self._unrealized[:count]
+        checked = self.chk_all.isChecked()
+        for entry in batch:
+            row = self._acquire_video_item(entry)
+            row.chk.setChecked(checked)
+            self.video_items.append(row)
+
+    def _on_video_scroll(self, value: int):
+        if self._unrealized and value >= self.video_scroll_area.verticalScrollBar().maximum() - 50:
+            self._realize_rows(self._ROW_BATCH)
+
+    def _acquire_download_item(self, title: str, item_id: str) -> _DownloadItem:
+        if self._item_pool:
+            w = self._item_pool.pop()
+            w.reset(title, item_id)
+            self.download_items_layout.removeWidget(w)
+        else:
+            w = _DownloadItem(title, item_id)
+            w.set_queued()
+        self.download_items_layout.addWidget(w)
+        w.show()
+        return w
+
+    def _release_download_items(self):
+        # Walk the layout rather than download_widgets: duplicate ids can
+        # leave rows that are shown but no longer keyed in the dict.
+        for i in range(self.download_items_layout.count()):
+            w = self.download_items_layout.itemAt(i).widget()
+            if isinstance(w, _DownloadItem) and not w.isHidden():
+                w.hide()
+                self._item_pool.append(w)
+        self.download_widgets.clear()
+        self._widgets_by_status.clear()
+        self._widget_status.clear()
+
+    def _set_widget_status(self, item_id: str, new_status: str):
+        old = self._widget_status.get(item_id)
+        if old is not None:
+            self._widgets_by_status[old].discard(item_id)
+        self._widget_status[item_id] = new_status
+        self._widgets_by_status[new_status].add(item_id)
+
+    def _fill_slots(self):
+        """Start queued downloads until every free slot is taken."""
         if self.is_paused:
-            self._log("⏸ Queue is paused - not starting new downloads")
+            self._log_debug("⏸ Queue is paused - not starting new downloads")
             return
         while self.current_downloads < self.max_concurrent_downloads and self.download_queue and not self.is_paused:
-            q = self.download_queue.pop(0)
-            item_id = q['item_id']
-            video = q['video']
-            w = q['widget']
-            # Use the selected format from radio buttons
-            audio_only = video.get('selected_format') == "mp3"
-            fetch_all = False
-            fetch_images = video.get('selected_format') == "image"
-            worker = _DownloadWorker(item_id, video, self.output_directory, video.get('selected_quality'), video.get('selected_subtitle'), audio_only, fetch_images, fetch_all)
-            worker.progress.connect(self._on_item_progress)
-            worker.progress_display.connect(self._on_progress_console)
-            worker.finished.connect(self._on_item_finished)
-            self.workers[item_id] = worker
-            self.thread_pool.start(_WorkerRunnable(worker))
-            w.set_downloading()
-            self.current_downloads += 1
-            self._log(f"🚀 Started download {self.current_downloads}/{self.max_concurrent_downloads}: {video.get('title','')[:50]}...")
+            self._start_one_from_queue()
         if self.download_queue and not self.is_paused:
-            self._log(f"⏳ {len(self.download_queue)} downloads queued, waiting for slots...")
+            self._log_debug(lambda: f"⏳ {len(self.download_queue)} downloads queued, waiting for slots...")
         elif self.download_queue and self.is_paused:
-            self._log(f"⏸ {len(self.download_queue)} downloads queued and paused")
+            self._log_debug(lambda: f"⏸ {len(self.download_queue)} downloads queued and paused")
+
+    def _start_one_from_queue(self):
+        q = self.download_queue.pop(0)
+        item_id = q['item_id']
+        video = q['video']
+        w = q['widget']
+        # Use the selected format from radio buttons
+        audio_only = video.get('selected_format') == "mp3"
+        fetch_all = False
+        fetch_images = video.get('selected_format') == "image"
+        worker = _DownloadWorker(item_id, video, self.output_directory, video.get('selected_quality'), video.get('selected_subtitle'), audio_only, fetch_images, fetch_all)
+        worker.progress.connect(self._on_item_progress)
+        worker.progress_display.connect(self._on_progress_console)
+        worker.finished.connect(self._on_item_finished)
+        self.workers[item_id] = worker
+        self.download_pool.start(_WorkerRunnable(worker))
+        w.set_downloading()
+        self._set_widget_status(item_id, "downloading")
+        self.current_downloads += 1
+        self._log_debug(lambda: f"🚀 Started download {self.current_downloads}/{self.max_concurrent_downloads}: {video.get('title','')[:50]}...")
 
     def _on_item_progress(self, item_id: str, percent: float, status: str):
         if item_id in self.download_widgets:
@@ -667,8 +911,7 @@ class UnifiedDownloaderGUI(QWidget):
             line = f"📦 [{ts}] {msg}"
         else:
             line = f"⬇️ [{ts}] {msg}"
-        self.progress_output.append(line)
-        self.progress_output.verticalScrollBar().setValue(self.progress_output.verticalScrollBar().maximum())
+        self._log_buffer.append(line)
 
     def _on_item_finished(self, item_id: str, result: dict):
         self.current_downloads -= 1
@@ -677,18 +920,21 @@ class UnifiedDownloaderGUI(QWidget):
             if result.get('success'):
                 self.completed_downloads += 1
                 self.download_widgets[item_id].set_completed()
+                self._set_widget_status(item_id, "completed")
                 self._log(f"✅ {result.get('message','Download completed')}")
             else:
                 self.failed_downloads += 1
                 self.download_widgets[item_id].set_failed(result.get('message','Unknown error'))
+                self._set_widget_status(item_id, "failed")
                 self._log(f"❌ {result.get('message','Download failed')} - Skipping to next item")
         if item_id in self.workers:
             del self.workers[item_id]
+        self._applied_progress.pop(item_id, None)
         if self.download_queue and not self.is_paused:
-            self._log("🔄 Download slot freed, starting next from queue...")
-            self._start_next()
+            self._log_debug("🔄 Download slot freed, starting next from queue...")
+            self._fill_slots()
         elif self.download_queue and self.is_paused:
-            self._log(f"⏸ Download slot freed, but queue is paused - {len(self.download_queue)} downloads remain queued")
+            self._log_debug(lambda: f"⏸ Download slot freed, but queue is paused - {len(self.download_queue)} downloads remain queued")
         self._refresh_stats()
         if self.active_downloads == 0 and not self.download_queue:
             self._all_finished()
@@ -718,21 +964,21 @@ class UnifiedDownloaderGUI(QWidget):
             self._log("⏸ Downloads paused - current downloads will complete, queue paused")
             for w in self.workers.values():
                 w.pause()
-            for item_id, widget in self.download_widgets.items():
-                if widget.status_icon.text() == "⬇️":
-                    widget.set_paused()
+            for item_id in list(self._widgets_by_status["downloading"]):
+                self.download_widgets[item_id].set_paused()
+                self._set_widget_status(item_id, "paused")
             self._log("⏳ Queue paused - remaining downloads will stay queued until resume")
         else:
             self.pause_button.setText("⏸ Pause")
             self._log("▶️ Downloads resumed")
             for w in self.workers.values():
                 w.resume()
-            for item_id, widget in self.download_widgets.items():
-                if widget.status_icon.text() == "⏸️":
-                    widget.set_downloading()
+            for item_id in list(self._widgets_by_status["paused"]):
+                self.download_widgets[item_id].set_downloading()
+                self._set_widget_status(item_id, "downloading")
             if self.download_queue:
                 self._log("🔄 Resuming queue processing...")
-                self._start_next()
+                self._fill_slots()
 
     def _cancel_all(self):
         self._log("\n❌ Cancelling all downloads...")
@@ -752,11 +998,18 @@ class UnifiedDownloaderGUI(QWidget):
 
     def _update_progress_bars(self):
         try:
-            for _, w in self.download_widgets.items():
-                if hasattr(w, 'bar'):
-                    w.bar.repaint()
-                    w.percent_text.repaint()
-                    w.status.repaint()
+            # While paused, rows keep their "Paused" text; the last snapshot
+            # is applied on the first tick after resume
+            if not self.is_paused:
+                applied = self._applied_progress
+                for item_id, worker in self.workers.items():
+                    latest = worker._latest_progress
+                    # The hook stores a new tuple per update, so identity says
+                    # whether this one has been shown yet
+                    if latest is not None and latest is not applied.get(item_id):
+                        applied[item_id] = latest
+                        self._on_item_progress(item_id, *latest)
+            self._flush_log()
         except Exception:
             pass
 
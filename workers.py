@@ -2,6 +2,8 @@ from PySide6.QtCore import QThread, Signal
 from firebase_client import FirebaseClient
 from config import _TEMP_SIGNUPS
 
+_extract = FirebaseClient._extract_field_value
+
 class SignupWorker(QThread):
     finished = Signal(bool, dict)  # success, payload
     progress = Signal(str)
@@ -49,6 +51,22 @@ class VerifyWorker(QThread):
 class LoginWorker(QThread):
     finished = Signal(bool, dict)
     
+    # (profile field, Firestore type, default); callable defaults get the email
+    _FIELD_SPEC = (
+        ("username", "string", lambda email: email.split("@")[0]),
+        ("membership", "boolean", False),
+        ("email_verified", "boolean", False),
+        ("membership_expires", "string", ""),
+        ("membership_type", "string", "none"),
+        ("referral_code", "string", ""),
+        ("referral_count", "integer", 0),
+        ("total_referred_count", "integer", 0),
+        ("active_referred_count", "integer", 0),
+        ("referred_by", "string", ""),
+        ("whatsapp", "string", ""),
+        ("free_trial_used", "boolean", False),
+    )
+    
     def __init__(self, email: str, password: str):
         super().__init__()
         self.email = email
@@ -70,62 +88,11 @@ class LoginWorker(QThread):
                     "localId": local_id,
                     "idToken": id_token,
                     "email": data.get("email", self.email),
-                    "username": FirebaseClient._extract_field_value(fields.get("username"), "string", self.email.split("@")[0]),
-                    "membership": FirebaseClient._extract_field_value(fields.get("membership"), "boolean", False),
-                    "email_verified": FirebaseClient._extract_field_value(fields.get("email_verified"), "boolean", False),
-                    "membership_expires": FirebaseClient._extract_field_value(fields.get("membership_expires"), "string", ""),
-                    "membership_type": FirebaseClient._extract_field_value(fields.get("membership_type"), "string", "none"),
-                    "referral_code": FirebaseClient._extract_field_value(fields.get("referral_code"), "string", ""),
-                    "referral_count": FirebaseClient._extract_field_value(fields.get("referral_count"), "integer", 0),
-                    "total_referred_count": FirebaseClient._extract_field_value(fields.get("total_referred_count"), "integer", 0),
-                    "active_referred_count": FirebaseClient._extract_field_value(fields.get("active_referred_count"), "integer", 0),
-                    "referred_by": FirebaseClient._extract_field_value(fields.get("referred_by"), "string", ""),
-                    "whatsapp": FirebaseClient._extract_field_value(fields.get("whatsapp"), "string", ""),
-                    "raw_profile": profile
                 }
-                
-                # Handle alternative data formats for referral fields
-                if not user["referral_code"]:
-                    if isinstance(fields.get("referral_code"), str):
-                        user["referral_code"] = fields["referral_code"]
-                    elif isinstance(fields.get("referral_code"), dict) and "stringValue" in fields["referral_code"]:
-                        user["referral_code"] = fields["referral_code"]["stringValue"]
-
-                if user["referral_count"] == 0:
-                    if isinstance(fields.get("referral_count"), int):
-                        user["referral_count"] = fields["referral_count"]
-                    elif isinstance(fields.get("referral_count"), str):
-                        try:
-                            user["referral_count"] = int(fields["referral_count"])
-                        except ValueError:
-                            user["referral_count"] = 0
-                    elif isinstance(fields.get("referral_count"), dict) and "integerValue" in fields["referral_count"]:
-                        try:
-                            user["referral_count"] = int(fields["referral_count"]["integerValue"])
-                        except ValueError:
-                            user["referral_count"] = 0
-
-                if not user["referred_by"]:
-                    if isinstance(fields.get("referred_by"), str):
-                        user["referred_by"] = fields["referred_by"]
-                    elif isinstance(fields.get("referred_by"), dict) and "stringValue" in fields["referred_by"]:
-                        user["referred_by"] = fields["referred_by"]["stringValue"]
-                
-                # Extract free_trial_used field
-                user["free_trial_used"] = FirebaseClient._extract_field_value(fields.get("free_trial_used"), "boolean", False)
-                if isinstance(user["free_trial_used"], str):
-                    user["free_trial_used"] = user["free_trial_used"].lower() == "true"
-                
-                # Ensure referral_count is always an integer
-                if isinstance(user["referral_count"], str):
-                    try:
-                        user["referral_count"] = int(user["referral_count"])
-                    except ValueError:
-                        user["referral_count"] = 0
-                if isinstance(user["membership"], str):
-                    user["membership"] = user["membership"].lower() == "true"
-                if isinstance(user["email_verified"], str):
-                    user["email_verified"] = user["email_verified"].lower() == "true"
+                for key, field_type, default in self._FIELD_SPEC:
+                    if callable(default):
+                        default = default(self.email)
+                    user[key] = _extract(fields.get(key), field_type, default)
                 self.finished.emit(True, user)
             else:
                 self.finished.emit(False, data)
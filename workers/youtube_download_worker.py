@@ -1,16 +1,17 @@
 from __future__ import annotations
 
-from typing import Optional, List, Dict
+import time
+from typing import Optional, List, Dict, Tuple
 from PySide6.QtCore import QObject, Signal
 
 from downloader_core import download_single_video_with_progress
 
 
 class YouTubeDownloadWorker(QObject):
-	sig_progress = Signal(float)  # overall percentage 0-100
-	sig_item_progress = Signal(int, float)  # index, percent for current item
 	sig_finished = Signal(dict)  # summary
 	sig_error = Signal(str)
+	# Emitted last from run(); owners delete the worker on this
+	sig_done = Signal()
 
 	def __init__(self, videos: List[Dict], output_dir: str, audio_only: bool) -> None:
 		super().__init__()
@@ -18,38 +19,63 @@ class YouTubeDownloadWorker(QObject):
 		self.output_dir = output_dir
 		self.audio_only = audio_only
 		self._cancelled = False
+		self._last_emit_ts = 0.0
+		# Current item index and completed count, read by _on_progress
+		self._idx = 0
+		self._completed = 0
+		self._total = len(videos)
+		# Latest (index, item percent, overall percent); polled by the GUI timer
+		self._latest: Optional[Tuple[int, float, float]] = None
 
 	def cancel(self) -> None:
 		self._cancelled = True
 
+	def latest(self) -> Optional[Tuple[int, float, float]]:
+		"""Latest (index, item percent, overall percent) snapshot, or None before the first."""
+		return self._latest
+
+	def _on_progress(self, d: Dict) -> None:
+		d_get = d.get
+		status = d_get("status", "")
+		# Only recompute "downloading" snapshots at ~20/s (see YtDlpWorker._progress_hook)
+		now = time.monotonic()
+		if status == "downloading" and now - self._last_emit_ts < 0.05:
+			return
+		self._last_emit_ts = now
+		percent = 0.0
+		if status == "downloading":
+			try:
+				downloaded = d_get("downloaded_bytes") or 0
+				all_bytes = d_get("total_bytes") or d_get("total_bytes_estimate") or 0
+				if all_bytes:
+					percent = max(0.0, min(100.0, (float(downloaded) / float(all_bytes)) * 100.0))
+				else:
+					ps = str(d_get("_percent_str") or "").strip().removesuffix("%")
+					percent = float(ps) if ps else 0.0
+			except Exception:
+				percent = 0.0
+		elif status == "finished":
+			percent = 100.0
+		overall = ((self._completed + (percent / 100.0)) / max(1, self._total)) * 100.0
+		self._latest = (self._idx, percent, overall)
+
 	def run(self) -> None:
+		try:
+			self._download_all()
+		finally:
+			self.sig_done.emit()
+
+	def _download_all(self) -> None:
 		total = len(self.videos)
-		completed = 0
+		self._total = total
+		self._completed = 0
 		results: List[Dict] = []
 
 		for idx, video in enumerate(self.videos):
 			if self._cancelled:
 				break
 
-			def hook(d):
-				status = d.get("status", "")
-				percent = 0.0
-				if status == "downloading":
-					try:
-						downloaded = d.get("downloaded_bytes") or 0
-						all_bytes = d.get("total_bytes") or d.get("total_bytes_estimate") or 0
-						if all_bytes:
-							percent = max(0.0, min(100.0, (float(downloaded) / float(all_bytes)) * 100.0))
-						else:
-							percent = float(str(d.get("_percent_str", "0%")).strip().strip("%"))
-					except Exception:
-						percent = 0.0
-				elif status == "finished":
-					percent = 100.0
-				self.sig_item_progress.emit(idx, percent)
-				overall = ((completed + (percent / 100.0)) / max(1, total)) * 100.0
-				self.sig_progress.emit(overall)
-
+			self._idx = idx
 			selected_quality: Optional[str] = video.get("selected_quality")
 			selected_subtitle: Optional[str] = video.get("selected_subtitle")
 			res = download_single_video_with_progress(
@@ -58,18 +84,18 @@ class YouTubeDownloadWorker(QObject):
 				quality=selected_quality,
 				subtitle=selected_subtitle,
 				audio_only=self.audio_only,
-				progress_hook=hook,
+				progress_hook=self._on_progress,
 			)
 			results.append({"url": video["url"], **res})
 			if res.get("success"):
-				completed += 1
-				self.sig_progress.emit((completed / max(1, total)) * 100.0)
+				self._completed += 1
+				self._latest = (idx, 100.0, (self._completed / max(1, total)) * 100.0)
 			else:
 				# continue to next item
 				pass
 
 		self.sig_finished.emit({
-			"completed": completed,
+			"completed": self._completed,
 			"total": total,
 			"results": results,
 			"cancelled": self._cancelled,
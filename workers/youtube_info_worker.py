@@ -8,6 +8,8 @@ from downloader_core import get_content_type, fetch_video_info, fetch_playlist_i
 class YouTubeInfoWorker(QObject):
 	sig_info = Signal(dict)  # emits info dict from downloader_core
 	sig_error = Signal(str)
+	# Emitted last from run(); owners delete the worker on this
+	sig_done = Signal()
 
 	def __init__(self, url: str, audio_only: bool) -> None:
 		super().__init__()
@@ -24,5 +26,7 @@ class YouTubeInfoWorker(QObject):
 			self.sig_info.emit(info)
 		except Exception as e:
 			self.sig_error.emit(str(e))
+		finally:
+			self.sig_done.emit()
 
 
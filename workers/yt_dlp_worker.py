@@ -1,28 +1,47 @@
 from __future__ import annotations
 
-import threading
-from typing import Optional, Dict, Any
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple
 
 from PySide6.QtCore import QObject, Signal
 
 
 class YtDlpWorker(QObject):
-	sig_progress = Signal(float, str, str, str)  # percent, speed, eta, status
 	sig_error = Signal(str)
 	sig_finished = Signal()
 	sig_formats = Signal(list, str)  # (formats, media_kind: 'video' | 'image' | 'other')
+	# Emitted last from run()/fetch_formats(), once the pool task is returning;
+	# owners delete the worker on this rather than on finished/error
+	sig_done = Signal()
 
 	def __init__(self, url: str, out_dir: str, ffmpeg_location: Optional[str]) -> None:
 		super().__init__()
 		self.url = url
 		self.out_dir = out_dir
 		self.ffmpeg_location = ffmpeg_location
-		self._cancel_event = threading.Event()
+		# Plain flag: a single attribute write is atomic, and reading it in the
+		# hot progress hook avoids Event.is_set()'s lock round-trip.
+		self._cancelled = False
+		self._last_emit_ts = 0.0
+		# Latest (percent, speed, eta, status); written by the progress hook and
+		# polled by the GUI timer instead of emitting a signal per callback
+		self._latest: Optional[Tuple[float, str, str, str]] = None
 
 	def request_cancel(self) -> None:
-		self._cancel_event.set()
+		self._cancelled = True
+
+	def latest(self) -> Optional[Tuple[float, str, str, str]]:
+		"""Latest (percent, speed, eta, status) snapshot, or None before the first."""
+		return self._latest
 
 	def fetch_formats(self) -> None:
+		try:
+			self._fetch_formats()
+		finally:
+			self.sig_done.emit()
+
+	def _fetch_formats(self) -> None:
 		try:
 			from yt_dlp import YoutubeDL
 		except Exception as e:
@@ -49,40 +68,35 @@ class YtDlpWorker(QObject):
 				media_kind = "image"
 			else:
 				# Consider it video if any format has a video codec
-				for f in formats:
-					if f.get("vcodec") and f.get("vcodec") != "none":
-						media_kind = "video"
-						break
-				if media_kind == "other" and info.get("duration"):
+				if any(f.get("vcodec") not in (None, "", "none") for f in formats) or info.get("duration"):
 					media_kind = "video"
 		except Exception:
 			pass
 
-		simplified = []
-		for f in formats:
-			ext = f.get("ext") or ""
-			height = f.get("height")
-			abr = f.get("abr")
-			acodec = f.get("acodec")
-			vcodec = f.get("vcodec")
-			fid = f.get("format_id")
-			tbr = f.get("tbr")
-			simplified.append({
-				"format_id": fid,
-				"ext": ext,
-				"height": height,
-				"abr": abr,
-				"tbr": tbr,
-				"acodec": acodec,
-				"vcodec": vcodec,
-			})
+		simplified = [
+			{
+				"format_id": f.get("format_id"),
+				"ext": f.get("ext") or "",
+				"height": f.get("height"),
+				"abr": f.get("abr"),
+				"tbr": f.get("tbr"),
+				"acodec": f.get("acodec"),
+				"vcodec": f.get("vcodec"),
+			}
+			for f in formats
+		]
 		self.sig_formats.emit(simplified, media_kind)
 
 	def _progress_hook(self, d: Dict[str, Any]) -> None:
-		if self._cancel_event.is_set():
+		if self._cancelled:
 			# yt-dlp does not support external cancellation cleanly; raise to abort.
 			raise RuntimeError("Cancelled by user")
 		status = d.get("status", "")
+		# yt-dlp can call this hundreds of times a second; only recompute
+		# "downloading" snapshots at ~20/s.
+		now = time.monotonic()
+		if status == "downloading" and now - self._last_emit_ts < 0.05:
+			return
 		percent = 0.0
 		speed = ""
 		eta = ""
@@ -91,10 +105,7 @@ class YtDlpWorker(QObject):
 		downloaded = d.get("downloaded_bytes") or 0
 		total = d.get("total_bytes") or d.get("total_bytes_estimate") or 0
 		if total and downloaded:
-			try:
-				percent = max(0.0, min(100.0, (float(downloaded) / float(total)) * 100.0))
-			except Exception:
-				percent = 0.0
+			percent = max(0.0, min(100.0, (float(downloaded) / float(total)) * 100.0))
 
 		# If fragments info is available (DASH/HLS), fallback to that
 		if percent == 0.0:
@@ -105,19 +116,17 @@ class YtDlpWorker(QObject):
 
 		# As last resort, parse percent string
 		if percent == 0.0:
-			try:
-				percent = float(str(d.get("_percent_str", "0%")).strip().strip("%"))
-			except Exception:
-				percent = 0.0
+			ps = str(d.get("_percent_str") or "").strip().removesuffix("%")
+			if ps.replace(".", "", 1).isdigit():
+				percent = float(ps)
 
 		# Speed and ETA strings from yt-dlp for nice formatting
 		speed = str(d.get("_speed_str", "")).strip()
 		eta_val = d.get("eta")
-		if eta_val is not None:
-			try:
-				eta = f"{int(eta_val)}s"
-			except Exception:
-				eta = str(eta_val)
+		if isinstance(eta_val, (int, float)):
+			eta = f"{int(eta_val)}s"
+		elif eta_val is not None:
+			eta = str(eta_val)
 
 		if status == "finished":
 			percent = 100.0
@@ -131,18 +140,24 @@ class YtDlpWorker(QObject):
 		elif norm_status == "postprocessing":
 			norm_status = "Post-processing"
 
-		self.sig_progress.emit(percent, speed, eta, norm_status)
+		self._last_emit_ts = now
+		self._latest = (percent, speed, eta, norm_status)
 
 	def run(self) -> None:
+		try:
+			self._download()
+		finally:
+			self.sig_done.emit()
+
+	def _download(self) -> None:
 		try:
 			from yt_dlp import YoutubeDL
 		except Exception as e:
 			self.sig_error.emit(f"yt-dlp not available: {e}")
 			return
 
-		outtmpl = "%(title)s.%(ext)s"
 		opts: Dict[str, Any] = {
-			"outtmpl": str((self.out_dir.rstrip("/\\") + "/" + outtmpl)),
+			"outtmpl": str(Path(self.out_dir) / "%(title)s.%(ext)s"),
 			"progress_hooks": [self._progress_hook],
 			"noprogress": True,
 			"quiet": True,
@@ -4,14 +4,18 @@ from PySide6.QtWidgets import (
     QComboBox, QSpinBox, QFileDialog, QGroupBox, QRadioButton,
     QButtonGroup, QScrollArea, QFrame, QCheckBox, QSplitter
 )
-from PySide6.QtCore import Qt, Signal, QObject, QSize, QRunnable, QThreadPool, QTimer, QThread
-from PySide6.QtGui import QFont, QIcon, QPixmap
+from PySide6.QtCore import Qt, Signal, QObject, QSize, QRunnable, QThreadPool, QTimer, QThread, QSettings
+from PySide6.QtGui import QFont, QIcon, QImage, QPixmap
 from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 from yt_dlp import YoutubeDL
 import os
+import re
 import sys
-from datetime import datetime
+import threading
+import weakref
+from functools import lru_cache
 import time
+from collections import OrderedDict, defaultdict, deque
 from pathlib import Path
 from typing import Optional, Dict, List
 from downloader_core import (
@@ -21,12 +25,76 @@ from downloader_core import (
     fetch_playlist_info,
     download_single_video_with_progress
 )
+from widgets.network import shared_network_manager
 
+# get_content_type runs a flat yt-dlp extraction; a URL's type doesn't change
+# within a session, so re-fetching the same link skips that round-trip
+_cached_content_type = lru_cache(maxsize=256)(get_content_type)
 
-class URLParsingWorker(QThread):
-    """QThread worker for parsing URLs"""
+# Diagnostic prints on the per-callback progress path; off unless requested
+DEBUG = os.environ.get('YTDL_GUI_DEBUG') == '1'
+
+_ANSI = re.compile(r'\x1b\[[0-9;]*m')
+
+
+def _strip_ansi(s: str) -> str:
+    return _ANSI.sub('', s) if s and '\x1b' in s else s
+
+
+# Styles for the per-row labels of VideoItemWidget / DownloadItemWidget. Set
+# once on the list containers and matched by object name, so Qt parses it
+# once instead of once per row.
+_ROW_QSS = """
+QLabel#rowThumbnail { border: 1px solid #ccc; background: #f0f0f0; }
+QLabel#rowTitle { font-weight: bold; }
+QLabel#rowDetail { color: #666; font-size: 11px; }
+QLabel#rowStatus { color: #666; font-size: 10px; }
+"""
+
+
+class _DownloadCancelled(Exception):
+    """Raised from the progress hook to abort a cancelled yt-dlp download."""
+
+    def __init__(self):
+        super().__init__("Download cancelled")
+
+
+_UNITS = ((1 << 30, 'GiB'), (1 << 20, 'MiB'), (1 << 10, 'KiB'))
+
+
+def _classify_stage(d: dict, filename: str) -> tuple:
+    """Return (download_stage, format label) for a yt-dlp progress dict."""
+    info = d.get('info_dict') or {}
+    vcodec = info.get('vcodec')
+    acodec = info.get('acodec')
+    if vcodec and acodec:
+        # Separate video/audio streams are later merged
+        if vcodec != 'none' and acodec == 'none':
+            return "video_download", "Video"
+        if acodec != 'none' and vcodec == 'none':
+            return "audio_download", "Audio"
+        return "downloading", "Format"
+    # No codec info: fall back to yt-dlp's .f<format_id> naming
+    if '.f' in filename and '.mp4' in filename:
+        return "video_download", "Video"
+    if '.f' in filename and ('.webm' in filename or '.m4a' in filename):
+        return "audio_download", "Audio"
+    return "downloading", "Format"
+
+
+def _fmt_bytes(n: int) -> str:
+    for size, unit in _UNITS:
+        if n >= size:
+            return f"{n / size:.2f}{unit}"
+    return f"{n}B"
+
+
+class URLParsingWorker(QObject):
+    """Pool worker for parsing URLs"""
     urls_parsed = Signal(list)
     error_occurred = Signal(str)
+    # Emitted exactly once after run(), whatever the outcome
+    finished = Signal()
     
     def __init__(self, urls_text):
         super().__init__()
@@ -38,73 +106,107 @@ class URLParsingWorker(QThread):
             self.urls_parsed.emit(urls)
         except Exception as e:
             self.error_occurred.emit(str(e))
+        finally:
+            self.finished.emit()
 
 
-class DirectoryCreationWorker(QThread):
-    """QThread worker for directory operations"""
-    directory_created = Signal(str)
-    error_occurred = Signal(str)
-    
-    def __init__(self, directory_path):
-        super().__init__()
-        self.directory_path = directory_path
-    
-    def run(self):
-        try:
-            os.makedirs(self.directory_path, exist_ok=True)
-            self.directory_created.emit(self.directory_path)
-        except Exception as e:
-            self.error_occurred.emit(str(e))
+class ThumbnailCache:
+    """LRU cache of scaled thumbnails, capped by approximate pixel bytes."""
 
+    def __init__(self, limit: int = 10 * 1024 * 1024):
+        self.cache = OrderedDict()
+        self.bytes = 0
+        self.limit = limit
 
-class ThumbnailCache:
-    def __init__(self):
-        self.cache = {}
+    @staticmethod
+    def _size_of(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * 4
 
     def get(self, url: str) -> Optional[QPixmap]:
-        return self.cache.get(url)
+        pixmap = self.cache.get(url)
+        if pixmap is not None:
+            self.cache.move_to_end(url)
+        return pixmap
 
     def set(self, url: str, pixmap: QPixmap):
+        old = self.cache.pop(url, None)
+        if old is not None:
+            self.bytes -= self._size_of(old)
         self.cache[url] = pixmap
+        self.bytes += self._size_of(pixmap)
+        self.trim(self.limit)
 
+    def trim(self, target_bytes: int):
+        """Evict least recently used thumbnails until at most target_bytes remain."""
+        while self.bytes > target_bytes and self.cache:
+            _, pixmap = self.cache.popitem(last=False)
+            self.bytes -= self._size_of(pixmap)
 
-class ThumbnailLoader(QObject):
-    thumbnail_loaded = Signal(str, QPixmap)
 
+class ThumbnailLoader(QObject):
     def __init__(self, cache: ThumbnailCache):
         super().__init__()
         self.cache = cache
-        self.network_manager = QNetworkAccessManager()
-
-    def load_thumbnail(self, video_id: str, url: str):
-        """Load thumbnail with proper QThread handling"""
+        # Same manager and on-disk cache as the other downloader tabs, so
+        # thumbnails survive restarts and aren't stored twice
+        self.network_manager = shared_network_manager()
+        # url -> [(video_id, weakref(widget))] waiting on that download, so
+        # each result goes straight to its rows instead of every row
+        self._subscribers: Dict[str, list] = {}
+
+    def load_thumbnail(self, video_id: str, url: str, widget: QWidget):
+        """Load a thumbnail and hand it to widget.on_thumbnail_loaded"""
         cached = self.cache.get(url)
         if cached:
-            self.thumbnail_loaded.emit(video_id, cached)
+            widget.on_thumbnail_loaded(video_id, cached)
             return
 
+        waiting = self._subscribers.get(url)
+        if waiting is not None:
+            # Already in flight; just wait for the same reply
+            waiting.append((video_id, weakref.ref(widget)))
+            return
+        self._subscribers[url] = [(video_id, weakref.ref(widget))]
+
         try:
             request = QNetworkRequest(url)
+            request.setAttribute(QNetworkRequest.Attribute.Http2AllowedAttribute, True)
+            request.setAttribute(QNetworkRequest.Attribute.HttpPipeliningAllowedAttribute, True)
+            request.setAttribute(QNetworkRequest.Attribute.CacheLoadControlAttribute, QNetworkRequest.CacheLoadControl.PreferCache)
             reply = self.network_manager.get(request)
-            reply.finished.connect(lambda: self.on_thumbnail_downloaded(video_id, url, reply))
+            reply.finished.connect(lambda: self.on_thumbnail_downloaded(url, reply))
         except Exception as e:
+            self._subscribers.pop(url, None)
             print(f"Thumbnail loading error: {e}")
 
-    def on_thumbnail_downloaded(self, video_id: str, url: str, reply: QNetworkReply):
+    def on_thumbnail_downloaded(self, url: str, reply: QNetworkReply):
+        waiting = self._subscribers.pop(url, [])
         if reply.error() == QNetworkReply.NetworkError.NoError:
             data = reply.readAll()
             pixmap = QPixmap()
             pixmap.loadFromData(data)
             if not pixmap.isNull():
                 scaled_pixmap = pixmap.scaled(120, 68, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                # Store in the premultiplied format the raster engine paints with
+                image = scaled_pixmap.toImage().convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+                scaled_pixmap = QPixmap.fromImage(image)
                 self.cache.set(url, scaled_pixmap)
-                self.thumbnail_loaded.emit(video_id, scaled_pixmap)
+                for video_id, ref in waiting:
+                    widget = ref()
+                    if widget is None:
+                        continue
+                    try:
+                        widget.on_thumbnail_loaded(video_id, scaled_pixmap)
+                    except RuntimeError:
+                        pass  # row was deleted while the download was in flight
         reply.deleteLater()
 
 
 class FetchInfoWorker(QObject):
     info_fetched = Signal(dict)
     error_occurred = Signal(str)
+    # Emitted exactly once after run(), whatever the outcome
+    finished = Signal()
 
     def __init__(self, url: str, audio_only: bool):
         super().__init__()
@@ -113,7 +215,7 @@ class FetchInfoWorker(QObject):
 
     def run(self):
         try:
-            content_type = get_content_type(self.url)
+            content_type = _cached_content_type(self.url)
 
             if content_type in ['playlist', 'channel']:
                 info = fetch_playlist_info(self.url, self.audio_only)
@@ -123,6 +225,8 @@ class FetchInfoWorker(QObject):
                 self.info_fetched.emit(info)
         except Exception as e:
             self.error_occurred.emit(str(e))
+        finally:
+            self.finished.emit()
 
 class WorkerRunnable(QRunnable):
     """Simple QRunnable wrapper that runs a QObject worker's run() method.
@@ -165,23 +269,23 @@ class VideoItemWidget(QWidget):
 
         self.thumbnail_label = QLabel()
         self.thumbnail_label.setFixedSize(120, 68)
-        self.thumbnail_label.setStyleSheet("border: 1px solid #ccc; background: #f0f0f0;")
-        self.thumbnail_label.setScaledContents(True)
+        self.thumbnail_label.setObjectName("rowThumbnail")
+        # Thumbnails arrive pre-scaled; paint them as-is rather than rescaling
+        self.thumbnail_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.thumbnail_label)
 
         if video_data.get('thumbnail_url'):
-            thumbnail_loader.thumbnail_loaded.connect(self.on_thumbnail_loaded)
-            thumbnail_loader.load_thumbnail(video_data['id'], video_data['thumbnail_url'])
+            thumbnail_loader.load_thumbnail(video_data['id'], video_data['thumbnail_url'], self)
 
         info_layout = QVBoxLayout()
         title_label = QLabel(video_data['title'])
         title_label.setWordWrap(True)
-        title_label.setStyleSheet("font-weight: bold;")
+        title_label.setObjectName("rowTitle")
         info_layout.addWidget(title_label)
 
         if video_data.get('duration'):
             duration_label = QLabel(f"Duration: {video_data['duration']}")
-            duration_label.setStyleSheet("color: #666; font-size: 11px;")
+            duration_label.setObjectName("rowDetail")
             info_layout.addWidget(duration_label)
         
         layout.addLayout(info_layout, stretch=1)
@@ -250,6 +354,8 @@ class DownloadItemWidget(QWidget):
     def __init__(self, title: str, item_id: str):
         super().__init__()
         self.item_id = item_id
+        # queued / downloading / paused / completed / failed; None until queued
+        self.status: Optional[str] = None
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
@@ -259,7 +365,7 @@ class DownloadItemWidget(QWidget):
         title_layout.addWidget(self.status_label)
 
         self.title_label = QLabel(title)
-        self.title_label.setStyleSheet("font-weight: bold;")
+        self.title_label.setObjectName("rowTitle")
         title_layout.addWidget(self.title_label, stretch=1)
 
         self.progress_text = QLabel("0%")
@@ -275,7 +381,7 @@ class DownloadItemWidget(QWidget):
         layout.addWidget(self.progress_bar)
 
         self.status_text = QLabel("Waiting...")
-        self.status_text.setStyleSheet("color: #666; font-size: 10px;")
+        self.status_text.setObjectName("rowStatus")
         layout.addWidget(self.status_text)
 
     def update_progress(self, percentage: float, status: str = ""):
@@ -290,35 +396,44 @@ class DownloadItemWidget(QWidget):
         self.status_text.setText(status)
 
     def set_queued(self):
+        self.status = "queued"
         self.status_label.setText("⏳")
         self.set_status("Queued...")
 
     def set_downloading(self):
+        self.status = "downloading"
         self.status_label.setText("⬇️")
         self.set_status("Downloading...")
 
     def set_completed(self):
+        self.status = "completed"
         self.status_label.setText("✅")
         self.progress_bar.setValue(100)
         self.progress_text.setText("100%")
         self.set_status("Completed")
 
     def set_failed(self, error: str):
+        self.status = "failed"
         self.status_label.setText("❌")
         self.set_status(f"Failed: {error}")
 
     def set_paused(self):
+        self.status = "paused"
         self.status_label.setText("⏸️")
         self.set_status("Paused")
 
 
 class DownloadWorker(QObject):
-    progress = Signal(str, float, str)
     finished = Signal(str, dict)
-    progress_display = Signal(str, str, float, str, str, str)  # item_id, filename, percent, speed, eta, progress_msg
+    # One payload for milestone events: id, pct, status, filename, speed, eta, msg
+    state = Signal(dict)
 
-    def __init__(self, item_id: str, video_data: dict, output_path: str, quality: str, subtitle: str, audio_only: bool, fetch_images: bool = False, fetch_all: bool = False):
+    def __init__(self, item_id: str, video_data: dict, output_path: str, quality: str, subtitle: str, audio_only: bool, fetch_images: bool = False, fetch_all: bool = False,
+                 *, pending: dict, pending_lock: threading.Lock):
         super().__init__()
+        # The GUI's item_id -> latest progress state; drained by its timer
+        self._pending = pending
+        self._pending_lock = pending_lock
         self.item_id = item_id
         self.video_data = video_data
         self.output_path = output_path
@@ -328,7 +443,9 @@ class DownloadWorker(QObject):
         self.fetch_images = fetch_images
         self.fetch_all = fetch_all
         self._is_running = True
-        self._is_paused = False
+        # Set while running; cleared on pause so the hook blocks until resume/stop
+        self._pause_event = threading.Event()
+        self._pause_event.set()
         
         # Track download stages
         self.download_stage = "starting"  # starting, video_download, audio_download, merging, completed
@@ -337,7 +454,21 @@ class DownloadWorker(QObject):
         self.current_format = ""
         self.total_formats = 0
         self.completed_formats = 0
-        self.last_progress_update = 0  # For throttling console output
+        # total_bytes rarely changes within a download; reuse its formatting
+        self._last_total = -1
+        self._last_total_str = "Unknown"
+        # filename -> (download_stage, format label), classified once per file
+        self._filename_stage: Dict[str, tuple] = {}
+
+    def _publish(self, status_text: str, filename: str, speed: str, eta: str, progress_msg: str, announce: bool = False):
+        """Record the latest state; milestones are also announced to the console."""
+        with self._pending_lock:
+            self._pending[self.item_id] = (self.overall_progress, status_text, filename, speed, eta, progress_msg)
+        if announce:
+            self.state.emit({
+                'id': self.item_id, 'pct': self.overall_progress, 'status': status_text,
+                'filename': filename, 'speed': speed, 'eta': eta, 'msg': progress_msg,
+            })
 
     def run(self):
         if not self._is_running:
@@ -345,13 +476,12 @@ class DownloadWorker(QObject):
 
         def progress_hook(d):
             if not self._is_running:
-                raise Exception("Download cancelled")
+                raise _DownloadCancelled
 
-            while self._is_paused:
+            if not self._pause_event.is_set():
+                self._pause_event.wait()
                 if not self._is_running:
-                    raise Exception("Download cancelled")
-                import time
-                time.sleep(0.1)
+                    raise _DownloadCancelled
 
             status = d.get('status', '')
             filename = d.get('filename', 'Unknown')
@@ -360,45 +490,32 @@ class DownloadWorker(QObject):
 
             # Handle different download stages
             if status == 'downloading':
-                import re
                 # Strip ANSI color codes from percentage string
                 percent_raw = d.get('_percent_str', '0%')
-                percent = re.sub(r'\x1b\[[0-9;]*m', '', percent_raw).replace('%', '').strip()
+                percent = _strip_ansi(percent_raw).replace('%', '').strip()
                 try:
                     percent_float = float(percent)
                     # Strip ANSI codes from speed and ETA strings
                     speed_raw = d.get('_speed_str', 'N/A')
                     eta_raw = d.get('_eta_str', 'N/A')
-                    speed = re.sub(r'\x1b\[[0-9;]*m', '', speed_raw) if speed_raw != 'N/A' else 'N/A'
-                    eta = re.sub(r'\x1b\[[0-9;]*m', '', eta_raw) if eta_raw != 'N/A' else 'N/A'
+                    speed = _strip_ansi(speed_raw) if speed_raw != 'N/A' else 'N/A'
+                    eta = _strip_ansi(eta_raw) if eta_raw != 'N/A' else 'N/A'
                     
                     # Extract file size information
                     total_bytes = d.get('total_bytes') or d.get('total_bytes_estimate', 0)
                     downloaded_bytes = d.get('downloaded_bytes', 0)
                     
                     # Format file size
-                    if total_bytes > 0:
-                        if total_bytes >= 1024 * 1024 * 1024:  # GB
-                            total_size = f"{total_bytes / (1024 * 1024 * 1024):.2f}GiB"
-                        elif total_bytes >= 1024 * 1024:  # MB
-                            total_size = f"{total_bytes / (1024 * 1024):.2f}MiB"
-                        elif total_bytes >= 1024:  # KB
-                            total_size = f"{total_bytes / 1024:.2f}KiB"
-                        else:
-                            total_size = f"{total_bytes}B"
-                    else:
-                        total_size = "Unknown"
+                    if total_bytes != self._last_total:
+                        self._last_total = total_bytes
+                        self._last_total_str = _fmt_bytes(total_bytes) if total_bytes > 0 else "Unknown"
+                    total_size = self._last_total_str
                     
-                    # Determine download stage based on filename
-                    if '.f' in filename and '.mp4' in filename:
-                        self.download_stage = "video_download"
-                        self.current_format = "Video"
-                    elif '.f' in filename and ('.webm' in filename or '.m4a' in filename):
-                        self.download_stage = "audio_download"
-                        self.current_format = "Audio"
-                    else:
-                        self.download_stage = "downloading"
-                        self.current_format = "Format"
+                    # Determine download stage once per file
+                    stage = self._filename_stage.get(filename)
+                    if stage is None:
+                        stage = self._filename_stage[filename] = _classify_stage(d, filename)
+                    self.download_stage, self.current_format = stage
                     
                     # Calculate overall progress based on stage
                     if self.download_stage == "video_download":
@@ -418,23 +535,12 @@ class DownloadWorker(QObject):
                     
                     status_text = f"{stage_msg} - {formatted_speed} | ETA: {formatted_eta}"
                     
-                    # Emit progress updates for live updates
-                    self.progress.emit(self.item_id, self.overall_progress, status_text)
-                    
-                    # Throttle console output to avoid spam, but keep progress bar live
-                    import time
-                    current_time = time.time()
-                    if current_time - self.last_progress_update >= 0.5:  # Update console every 0.5 seconds
-                        self.progress_display.emit(self.item_id, filename, self.overall_progress, formatted_speed, formatted_eta, progress_msg)
-                        self.last_progress_update = current_time
-                        print(f"DEBUG: Progress update - {self.item_id}: {self.overall_progress:.1f}%")
-                    
-                    # Force immediate UI update
-                    QApplication.processEvents()
+                    # Only record the latest state; the GUI timer picks it up
+                    self._publish(status_text, filename, formatted_speed, formatted_eta, progress_msg)
                     
                 except Exception as e:
-                    print(f"Progress hook error: {e}")
-                    pass
+                    if DEBUG:
+                        print(f"Progress hook error: {e}")
                     
             elif status == 'finished':
                 # Handle completed downloads
@@ -443,8 +549,7 @@ class DownloadWorker(QObject):
                     self.overall_progress = 90
                     progress_msg = "[Merger] Merging formats..."
                     status_text = "Merging video and audio formats"
-                    self.progress.emit(self.item_id, self.overall_progress, status_text)
-                    self.progress_display.emit(self.item_id, filename, self.overall_progress, "N/A", "N/A", progress_msg)
+                    self._publish(status_text, filename, "N/A", "N/A", progress_msg, announce=True)
                 else:
                     # Format download completed
                     self.completed_formats += 1
@@ -455,8 +560,7 @@ class DownloadWorker(QObject):
                     
                     progress_msg = f"[download] 100% of format completed"
                     status_text = f"{self.current_format} download completed"
-                    self.progress.emit(self.item_id, self.overall_progress, status_text)
-                    self.progress_display.emit(self.item_id, filename, self.overall_progress, "N/A", "N/A", progress_msg)
+                    self._publish(status_text, filename, "N/A", "N/A", progress_msg, announce=True)
 
         try:
             result = download_single_video_with_progress(
@@ -475,9 +579,7 @@ class DownloadWorker(QObject):
                 self.download_stage = "completed"
                 self.overall_progress = 100.0
                 progress_msg = "[download] 100% - Download completed successfully!"
-                status_text = "Download completed"
-                self.progress.emit(self.item_id, self.overall_progress, status_text)
-                self.progress_display.emit(self.item_id, "Final", self.overall_progress, "N/A", "N/A", progress_msg)
+                self._publish("Download completed", "Final", "N/A", "N/A", progress_msg, announce=True)
             
             self.finished.emit(self.item_id, result)
         except Exception as e:
@@ -487,27 +589,62 @@ class DownloadWorker(QObject):
             })
 
     def pause(self):
-        self._is_paused = True
+        self._pause_event.clear()
 
     def resume(self):
-        self._is_paused = False
+        self._pause_event.set()
 
     def stop(self):
         self._is_running = False
+        # Wake a paused hook so it can see the cancellation
+        self._pause_event.set()
 
 
 class YouTubeDownloaderGUI(QWidget):
+    # Video rows are built in batches as the selection list is scrolled
+    _ROW_BATCH = 50
+    # Completed download rows kept on screen before the oldest are dropped
+    _COMPLETED_ROWS = 20
+    # Console filter: yt-dlp extraction chatter is dropped, and otherwise only
+    # download/progress/result messages are shown (matched on lowercase text)
+    _SKIP_RE = re.compile(
+        r'extracting url|downloading webpage|downloading tv client config'
+        r'|downloading tv player api json|downloading web safari player api json'
+        r'|downloading m3u8 information|downloading 1 format|has already been downloaded'
+    )
+    _SHOW_RE = re.compile(r'download|progress|completed|failed|error|success')
+
     def __init__(self):
         super().__init__()
-        self.threads = []
         self.workers = {}
-        # thread pool for running background tasks (fetch/download)
+        # Info fetches in flight, keyed by id(worker) so the same URL fetched
+        # twice gets two entries; each stays referenced until it is destroyed
+        self.fetch_workers = {}
+        self.settings = QSettings("YouTubeDownloader", "MultiContentPro")
+        # Default to the core count clamped to a range that suits network-bound
+        # downloads; a value the user picked on a previous run takes precedence
+        default_concurrent = min(8, max(2, QThread.idealThreadCount()))
+        self.max_concurrent_downloads = int(self.settings.value("max_concurrent_downloads", default_concurrent))
+        # thread pool for running downloads
         self.thread_pool = QThreadPool.globalInstance()
-        # Set maximum thread count to match our concurrent download limit
-        self.thread_pool.setMaxThreadCount(2)
+        # Keep the pool size in step with the concurrent download limit
+        self.thread_pool.setMaxThreadCount(self.max_concurrent_downloads)
+        # Separate pool for URL parsing / info fetches: they are network-bound,
+        # so several can run at once without waiting on download slots
+        self.info_pool = QThreadPool(self)
+        self.info_pool.setMaxThreadCount(min(8, QThread.idealThreadCount()))
         self.download_widgets = {}
+        # Download item ids bucketed by widget status, so pause/resume only
+        # visit the rows they change instead of comparing every row's icon
+        self._widgets_by_status: Dict[str, set] = defaultdict(set)
+        # Completed item ids in finish order, oldest first
+        self._completed_rows = deque()
+        # (active, completed, failed, overall %) last shown by update_stats
+        self._last_stats = (None, None, None, None)
         self.video_items = []
         self.fetched_videos = []
+        # Fetched videos that don't have a row widget yet (tail of fetched_videos)
+        self._unrealized: List[dict] = []
         self.active_downloads = 0
         self.completed_downloads = 0
         self.failed_downloads = 0
@@ -517,15 +654,27 @@ class YouTubeDownloaderGUI(QWidget):
         self.is_paused = False
         
         # Download queue management
-        self.download_queue = []
-        self.max_concurrent_downloads = 1
+        self.download_queue = deque()
         self.current_downloads = 0
         self.selected_format = 'mp4'  # Default to MP4
+
+        # Latest progress per download, written by worker hooks and drained
+        # by the progress timer (one UI update per item per tick)
+        self._pending: Dict[str, tuple] = {}
+        self._pending_lock = threading.Lock()
+        # item_id -> last integer percent written to its row
+        self._last_progress_emit: Dict[str, int] = {}
+        self._last_console_update = 0.0
+        # (epoch second, "HH:MM:SS") so bursts of lines share one strftime
+        self._ts_cache = (-1, "")
+        # Console lines not yet shown; appended to progress_output once per tick
+        self._log_buf = deque(maxlen=2000)
         
-        # Timer for smooth progress updates
+        # Drains worker progress and buffered console lines; runs only while
+        # there is something to apply and stops itself once idle
         self.progress_timer = QTimer()
+        self.progress_timer.setInterval(100)  # Update every 100ms
         self.progress_timer.timeout.connect(self.update_progress_bars)
-        self.progress_timer.start(100)  # Update every 100ms
 
         self.init_ui()
 
@@ -661,9 +810,11 @@ class YouTubeDownloaderGUI(QWidget):
         self.video_scroll_area.setMaximumHeight(250)
 
         self.video_list_widget = QWidget()
+        self.video_list_widget.setStyleSheet(_ROW_QSS)
         self.video_list_layout = QVBoxLayout(self.video_list_widget)
         self.video_list_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         self.video_scroll_area.setWidget(self.video_list_widget)
+        self.video_scroll_area.verticalScrollBar().valueChanged.connect(self._on_video_scroll)
 
         video_list_layout.addWidget(self.video_scroll_area)
         self.video_list_group.setLayout(video_list_layout)
@@ -692,8 +843,8 @@ class YouTubeDownloaderGUI(QWidget):
         workers_layout.addWidget(QLabel("Concurrent Downloads:"))
         self.workers_spinbox = QSpinBox()
         self.workers_spinbox.setMinimum(1)
-        self.workers_spinbox.setMaximum(2)
-        self.workers_spinbox.setValue(1)
+        self.workers_spinbox.setMaximum(16)
+        self.workers_spinbox.setValue(self.max_concurrent_downloads)
         self.workers_spinbox.setMaximumWidth(80)
         workers_layout.addWidget(self.workers_spinbox)
         workers_layout.addStretch()
@@ -712,6 +863,8 @@ class YouTubeDownloaderGUI(QWidget):
         self.progress_output = QTextEdit()
         self.progress_output.setReadOnly(True)
         self.progress_output.setMaximumHeight(120)
+        # Keep a rolling window; Qt drops the oldest blocks past the limit
+        self.progress_output.document().setMaximumBlockCount(2000)
         self.progress_output.setStyleSheet("""
             QTextEdit {
                 background-color: #0d1117;
@@ -824,6 +977,7 @@ class YouTubeDownloaderGUI(QWidget):
         self.download_items_scroll.setMaximumHeight(200)
 
         self.download_items_widget = QWidget()
+        self.download_items_widget.setStyleSheet(_ROW_QSS)
         self.download_items_layout = QVBoxLayout(self.download_items_widget)
         self.download_items_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         self.download_items_scroll.setWidget(self.download_items_widget)
@@ -840,7 +994,11 @@ class YouTubeDownloaderGUI(QWidget):
         """Update maximum concurrent downloads when spinbox value changes"""
         self.max_concurrent_downloads = value
         self.thread_pool.setMaxThreadCount(value)
+        self.settings.setValue("max_concurrent_downloads", value)
         self.log_message(f"🔧 Max concurrent downloads set to: {value}")
+        # Fill any newly opened slots now rather than on the next finish
+        if self.download_queue and not self.is_paused:
+            self.start_next_downloads()
 
 
     def browse_output_directory(self):
@@ -865,73 +1023,125 @@ class YouTubeDownloaderGUI(QWidget):
         except Exception as e:
             self.log_message(f"❌ Error browsing directory: {e}")
 
+    def _timestamp(self) -> str:
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        return self._ts_cache[1]
+
     def log_message(self, message):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        
+        low = message.lower()
         # Filter out YouTube extraction messages and only show download progress
-        if any(keyword in message.lower() for keyword in [
-            'extracting url', 'downloading webpage', 'downloading tv client config',
-            'downloading tv player api json', 'downloading web safari player api json',
-            'downloading m3u8 information', 'downloading 1 format', 'has already been downloaded'
-        ]):
+        if self._SKIP_RE.search(low):
             return  # Skip these messages
         
         # Show only download progress and important messages
-        if any(keyword in message.lower() for keyword in [
-            'download', 'progress', 'completed', 'failed', 'error', 'success'
-        ]) or message.startswith('[') and '%' in message:
-            self.progress_output.append(f"[{timestamp}] {message}")
-            self.progress_output.verticalScrollBar().setValue(
-                self.progress_output.verticalScrollBar().maximum()
-            )
+        if self._SHOW_RE.search(low) or message.startswith('[') and '%' in message:
+            self._append_log(f"[{self._timestamp()}] {message}")
+
+    def _append_log(self, line: str):
+        """Buffer a console line and make sure the timer is running to flush it"""
+        self._log_buf.append(line)
+        if not self.progress_timer.isActive():
+            self.progress_timer.start()
 
     def show_download_progress(self, item_id: str, filename: str, percent: float, speed: str, eta: str, progress_msg: str):
         """Display beautiful download progress in the progress output"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = self._timestamp()
+        low = progress_msg.lower()
         
         # Format the progress message beautifully
         if percent >= 100:
             progress_display = f"✅ [{timestamp}] Download completed successfully!"
-        elif "merging" in progress_msg.lower() or "merger" in progress_msg.lower():
+        elif "merging" in low or "merger" in low:
             progress_display = f"🔧 [{timestamp}] {progress_msg}"
         elif "100%" in progress_msg:
             progress_display = f"📦 [{timestamp}] {progress_msg}"
         else:
             progress_display = f"⬇️ [{timestamp}] {progress_msg}"
         
-        self.progress_output.append(progress_display)
-        self.progress_output.verticalScrollBar().setValue(
-            self.progress_output.verticalScrollBar().maximum()
-        )
+        self._append_log(progress_display)
+
+    def on_worker_state(self, state: dict):
+        """Console line for a worker milestone (format done, merging, finished)"""
+        self.show_download_progress(state['id'], state['filename'], state['pct'], state['speed'], state['eta'], state['msg'])
+
+    def _flush_log(self):
+        """Append all buffered console lines in one go and scroll once"""
+        if not self._log_buf:
+            return
+        text = '\n'.join(self._log_buf)
+        self._log_buf.clear()
+        self.progress_output.append(text)
+        scrollbar = self.progress_output.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
 
     def update_progress_bars(self):
-        """Update progress bars smoothly"""
-        try:
-            # Force UI updates for all active downloads
-            for item_id, widget in self.download_widgets.items():
-                if hasattr(widget, 'progress_bar'):
-                    widget.progress_bar.repaint()
-                    widget.progress_text.repaint()
-                    widget.status_text.repaint()
-        except Exception as e:
-            pass  # Ignore errors in timer updates
+        """Apply the latest progress state of each active download"""
+        with self._pending_lock:
+            pending = list(self._pending.items())
+            self._pending.clear()
+        if not pending:
+            self._flush_log()
+            if not self.workers:
+                self.progress_timer.stop()
+            return
+        # Console lines keep their previous 0.5 s cadence
+        now = time.monotonic()
+        show_console = now - self._last_console_update >= 0.5
+        if show_console:
+            self._last_console_update = now
+        for item_id, (percent, status_text, filename, speed, eta, progress_msg) in pending:
+            # One bad row must not drop the rest of this tick's snapshots
+            try:
+                self.on_download_progress(item_id, percent, status_text)
+                if show_console:
+                    self.show_download_progress(item_id, filename, percent, speed, eta, progress_msg)
+            except Exception as e:
+                if DEBUG:
+                    print(f"Progress update error for {item_id}: {e}")
+        self._flush_log()
 
     def update_stats(self):
-        self.active_label.setText(f"Active: {self.active_downloads}")
-        self.completed_label.setText(f"✅ Completed: {self.completed_downloads}")
-        self.failed_label.setText(f"❌ Failed: {self.failed_downloads}")
-
         total = self.completed_downloads + self.failed_downloads + self.active_downloads
-        if total > 0:
-            progress = int((self.completed_downloads + self.failed_downloads) / total * 100)
+        progress = int((self.completed_downloads + self.failed_downloads) / total * 100) if total > 0 else None
+        stats = (self.active_downloads, self.completed_downloads, self.failed_downloads, progress)
+        last = self._last_stats
+        if stats == last:
+            return
+        self._last_stats = stats
+
+        # Only touch the widgets whose value actually changed
+        if stats[0] != last[0]:
+            self.active_label.setText(f"Active: {self.active_downloads}")
+        if stats[1] != last[1]:
+            self.completed_label.setText(f"✅ Completed: {self.completed_downloads}")
+        if stats[2] != last[2]:
+            self.failed_label.setText(f"❌ Failed: {self.failed_downloads}")
+        if progress is not None and progress != last[3]:
             self.overall_progress.setValue(progress)
 
+    @staticmethod
+    def _clear_layout(layout):
+        """Remove and delete every widget in layout, tail first."""
+        # takeAt(0) shifts every remaining item; popping from the end doesn't
+        for i in range(layout.count() - 1, -1, -1):
+            widget = layout.takeAt(i).widget()
+            if widget:
+                widget.setParent(None)
+                widget.deleteLater()
+
     def toggle_select_all(self, state):
+        checked = self.select_all_checkbox.isChecked()
+        # Nothing listens to the row checkboxes, so skip N stateChanged emits
         for item_widget in self.video_items:
-            item_widget.checkbox.setChecked(state == Qt.CheckState.Checked)
+            checkbox = item_widget.checkbox
+            checkbox.blockSignals(True)
+            checkbox.setChecked(checked)
+            checkbox.blockSignals(False)
 
     def fetch_info(self):
-        """Fetch video info using QThread for GUI sustainability"""
+        """Fetch video info on the thread pool for GUI sustainability"""
         urls_text = self.url_input.toPlainText().strip()
 
         if not urls_text:
@@ -946,8 +1156,8 @@ class YouTubeDownloaderGUI(QWidget):
         self.url_worker = URLParsingWorker(urls_text)
         self.url_worker.urls_parsed.connect(self.on_urls_parsed)
         self.url_worker.error_occurred.connect(self.on_url_parsing_error)
-        self.url_worker.finished.connect(self.url_worker.deleteLater)
-        self.url_worker.start()
+        self.url_worker.finished.connect(self.url_worker.deleteLater, Qt.ConnectionType.QueuedConnection)
+        self.info_pool.start(WorkerRunnable(self.url_worker))
 
     def on_urls_parsed(self, urls):
         """Handle parsed URLs"""
@@ -961,13 +1171,11 @@ class YouTubeDownloaderGUI(QWidget):
         self.fetch_info_button.setText("⏳ Fetching...")
 
         # Clear existing widgets
-        while self.video_list_layout.count():
-            child = self.video_list_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        self._clear_layout(self.video_list_layout)
 
         self.video_items.clear()
         self.fetched_videos.clear()
+        self._unrealized.clear()
 
         # Fetch all formats by default
         audio_only = False
@@ -979,10 +1187,11 @@ class YouTubeDownloaderGUI(QWidget):
             worker = FetchInfoWorker(url, audio_only)
             worker.info_fetched.connect(self.on_info_fetched)
             worker.error_occurred.connect(self.on_fetch_error)
-            worker.info_fetched.connect(worker.deleteLater)
-            worker.error_occurred.connect(worker.deleteLater)
-            runnable = WorkerRunnable(worker)
-            self.thread_pool.start(runnable)
+            worker.finished.connect(worker.deleteLater, Qt.ConnectionType.QueuedConnection)
+            key = id(worker)
+            worker.destroyed.connect(lambda _=None, k=key: self.fetch_workers.pop(k, None))
+            self.fetch_workers[key] = worker
+            self.info_pool.start(WorkerRunnable(worker))
 
     def on_url_parsing_error(self, error):
         """Handle URL parsing error"""
@@ -993,45 +1202,84 @@ class YouTubeDownloaderGUI(QWidget):
 
     def on_info_fetched(self, info: dict):
         if info.get('type') == 'video':
-            video_item = VideoItemWidget(info, self.thumbnail_loader)
-            self.video_list_layout.addWidget(video_item)
-            self.video_items.append(video_item)
             self.fetched_videos.append(info)
+            self._unrealized.append(info)
             self.log_message(f"✅ Fetched: {info['title']}")
 
         elif info.get('type') in ['playlist', 'channel']:
             videos = info.get('videos', [])
             self.log_message(f"✅ Fetched {info['type']}: {info.get('title', 'Unknown')} ({len(videos)} videos)")
+            self.fetched_videos.extend(videos)
+            self._unrealized.extend(videos)
 
-            for video in videos:
-                video_item = VideoItemWidget(video, self.thumbnail_loader)
-                self.video_list_layout.addWidget(video_item)
-                self.video_items.append(video_item)
-                self.fetched_videos.append(video)
+        # Only build the first screenful or so; the rest follow on scroll
+        if len(self.video_items) < self._ROW_BATCH:
+            self._realize_rows(self._ROW_BATCH - len(self.video_items))
 
         self.video_list_group.setVisible(True)
         self.fetch_info_button.setEnabled(True)
         self.fetch_info_button.setText("🔍 Fetch Info")
 
+    def _realize_rows(self, count: int):
+        """Build row widgets for the next ``count`` fetched videos."""
+        batch = self._unrealized[:count]
+        if not batch:
+            return
+        del self._unrealized[:count]
+        checked = self.select_all_checkbox.isChecked()
+        # Suspend painting so the batch is laid out and drawn once
+        container = self.video_list_widget
+        container.setUpdatesEnabled(False)
+        try:
+            for video in batch:
+                video_item = VideoItemWidget(video, self.thumbnail_loader)
+                video_item.checkbox.setChecked(checked)
+                if self.selected_format != 'mp4':
+                    video_item.update_format(self.selected_format)
+                self.video_list_layout.addWidget(video_item)
+                self.video_items.append(video_item)
+        finally:
+            container.setUpdatesEnabled(True)
+
+    def _on_video_scroll(self, value: int):
+        if self._unrealized and value >= self.video_scroll_area.verticalScrollBar().maximum() - 50:
+            self._realize_rows(self._ROW_BATCH)
+
+    def _default_quality(self, video: dict) -> str:
+        """Quality an unbuilt row would show for the current format."""
+        if self.selected_format == 'mp3':
+            return '320 kbps'
+        if self.selected_format == 'image':
+            return 'Original'
+        return (video.get('qualities') or ['Best Available'])[0]
+
     def on_fetch_error(self, error: str):
         self.log_message(f"❌ Fetch error: {error}")
         self.fetch_info_button.setEnabled(True)
         self.fetch_info_button.setText("🔍 Fetch Info")
 
     def start_download(self):
-        """Start download process using QThread for GUI sustainability"""
+        """Start download process"""
         if not self.fetched_videos:
             self.log_message("❌ Please fetch video info first!")
             return
 
         selected_videos = []
-        for i, item_widget in enumerate(self.video_items):
+        for item_widget in self.video_items:
             if item_widget.is_selected():
-                video_data = self.fetched_videos[i].copy()
+                video_data = item_widget.video_data.copy()
                 video_data['selected_quality'] = item_widget.get_selected_quality()
                 video_data['selected_subtitle'] = item_widget.get_selected_subtitle()
                 video_data['selected_format'] = self.selected_format  # Use global selected format
                 selected_videos.append(video_data)
+        if self.select_all_checkbox.isChecked():
+            # Rows never scrolled into view keep their default choices
+            for video in self._unrealized:
+                video_data = video.copy()
+                video_data['selected_quality'] = self._default_quality(video)
+                video_data['selected_subtitle'] = None
+                video_data['selected_format'] = self.selected_format
+                selected_videos.append(video_data)
 
         if not selected_videos:
             self.log_message("❌ No videos selected!")
@@ -1053,25 +1301,23 @@ class YouTubeDownloaderGUI(QWidget):
         # Store selected videos for later use
         self.pending_selected_videos = selected_videos
 
-        # Create directory creation worker
-        self.dir_worker = DirectoryCreationWorker(self.output_directory)
-        self.dir_worker.directory_created.connect(self.on_directory_created)
-        self.dir_worker.error_occurred.connect(self.on_directory_error)
-        self.dir_worker.finished.connect(self.dir_worker.deleteLater)
-        self.dir_worker.start()
+        # mkdir takes microseconds; no need for a worker round-trip
+        try:
+            os.makedirs(self.output_directory, exist_ok=True)
+        except OSError as e:
+            self.on_directory_error(str(e))
+            return
+        self.on_directory_created(self.output_directory)
 
     def on_directory_created(self, directory_path):
         """Handle directory creation completion"""
         try:
             # Clear existing widgets
-            while self.download_items_layout.count():
-                child = self.download_items_layout.takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
+            self._clear_layout(self.download_items_layout)
 
             self.download_widgets.clear()
+            self._widgets_by_status.clear()
             self.workers.clear()
-            self.threads.clear()
 
             self.active_downloads = len(self.pending_selected_videos)
             self.completed_downloads = 0
@@ -1079,25 +1325,19 @@ class YouTubeDownloaderGUI(QWidget):
             self.current_downloads = 0
             self.update_stats()
 
-            # Fetch all formats by default
-            audio_only = False
-            fetch_all = True
-            fetch_images = True
-
-            # Create download queue instead of starting all at once
-            self.download_queue = []
+            # Create download queue instead of starting all at once. Entries
+            # are plain dicts; a row widget is only built when one starts
+            self.download_queue.clear()
+            self._completed_rows.clear()
             for video in self.pending_selected_videos:
-                item_id = video['id']
-                download_widget = DownloadItemWidget(video['title'], item_id)
-                self.download_items_layout.addWidget(download_widget)
-                self.download_widgets[item_id] = download_widget
-                
-                # Add to queue with status
-                download_widget.set_queued()
+                # Worker flags are fixed once queued; work them out here
+                # rather than on every pass of start_next_downloads
+                selected_format = video.get('selected_format', 'mp4')
                 self.download_queue.append({
-                    'item_id': item_id,
+                    'item_id': video['id'],
                     'video': video,
-                    'download_widget': download_widget
+                    'audio_only': selected_format == "mp3",
+                    'fetch_images': selected_format == "image",
                 })
 
             # Start initial downloads (up to max_concurrent_downloads)
@@ -1123,45 +1363,40 @@ class YouTubeDownloaderGUI(QWidget):
                not self.is_paused):  # Check pause status in loop
             
             # Get next item from queue
-            queue_item = self.download_queue.pop(0)
+            queue_item = self.download_queue.popleft()
             item_id = queue_item['item_id']
             video = queue_item['video']
-            download_widget = queue_item['download_widget']
-            
-            # Start download
-            # Use the selected format from radio buttons
-            selected_format = video.get('selected_format', 'mp4')
-            audio_only = selected_format == "mp3"
-            fetch_all = False
-            fetch_images = selected_format == "image"
-            
-            # For YouTube, when image format is selected, we only want thumbnails
-            if fetch_images and 'youtube.com' in video.get('url', ''):
-                fetch_images = True
-                audio_only = False
-                # We'll handle thumbnail download specially in the download function
+            download_widget = DownloadItemWidget(video['title'], item_id)
+            self.download_items_layout.addWidget(download_widget)
+            self.download_widgets[item_id] = download_widget
+
+            # Start download; for image format the download function only
+            # fetches thumbnails
             worker = DownloadWorker(
                 item_id,
                 video,
                 self.output_directory,
                 video.get('selected_quality'),
                 video.get('selected_subtitle'),
-                audio_only,
-                fetch_images,
-                fetch_all
+                queue_item['audio_only'],
+                queue_item['fetch_images'],
+                False,
+                pending=self._pending,
+                pending_lock=self._pending_lock
             )
-            worker.progress.connect(self.on_download_progress)
-            worker.progress_display.connect(self.show_download_progress)
+            worker.state.connect(self.on_worker_state)
             worker.finished.connect(self.on_download_finished)
             worker.finished.connect(worker.deleteLater)
             
             # Keep worker reference for pause/cancel control
             self.workers[item_id] = worker
+            if not self.progress_timer.isActive():
+                self.progress_timer.start()
             runnable = WorkerRunnable(worker)
             self.thread_pool.start(runnable)
             
             # Update status
-            download_widget.set_downloading()
+            self._set_item_status(item_id, download_widget, "downloading")
             self.current_downloads += 1
             
             self.log_message(f"🚀 Started download {self.current_downloads}/{self.max_concurrent_downloads}: {video['title'][:50]}...")
@@ -1187,32 +1422,56 @@ class YouTubeDownloaderGUI(QWidget):
     def on_download_progress(self, item_id: str, percent: float, status: str):
         """Update progress bar for a single download item."""
         try:
-            print(f"DEBUG: on_download_progress called - {item_id}: {percent:.1f}%")
-            if item_id in self.download_widgets:
-                item_widget = self.download_widgets[item_id]
-                if hasattr(item_widget, 'progress_bar'):
-                    item_widget.progress_bar.setValue(int(percent))
-                    item_widget.progress_text.setText(f"{int(percent)}%")
-                    item_widget.status_text.setText(status)
-                    print(f"DEBUG: Progress bar updated - {item_id}: {percent:.1f}%")
-                    
-                    # Force immediate UI update
-                    QApplication.processEvents()
+            item_widget = self.download_widgets.get(item_id)
+            if item_widget is not None:
+                # Calls already arrive at the timer's 10 Hz; also skip
+                # the bar/label writes when the whole percent is unchanged
+                pct = int(percent)
+                if self._last_progress_emit.get(item_id) != pct:
+                    self._last_progress_emit[item_id] = pct
+                    item_widget.progress_bar.setValue(pct)
+                    item_widget.progress_text.setText(f"{pct}%")
+                item_widget.status_text.setText(status)
         except Exception as e:
-            print(f"Progress update error: {e}")
+            if DEBUG:
+                print(f"Progress update error: {e}")
+    def _set_item_status(self, item_id: str, widget: DownloadItemWidget, status: str, *args):
+        """Move a download row to a new status, keeping _widgets_by_status in step"""
+        old = widget.status
+        if old is not None:
+            self._widgets_by_status[old].discard(item_id)
+        getattr(widget, f"set_{status}")(*args)
+        self._widgets_by_status[status].add(item_id)
+
+    def _retire_completed_row(self, item_id: str):
+        """Keep only the most recent completed rows; failed rows stay visible"""
+        self._completed_rows.append(item_id)
+        while len(self._completed_rows) > self._COMPLETED_ROWS:
+            old_id = self._completed_rows.popleft()
+            self._widgets_by_status["completed"].discard(old_id)
+            widget = self.download_widgets.pop(old_id, None)
+            if widget is not None:
+                self.download_items_layout.removeWidget(widget)
+                widget.deleteLater()
+
     def on_download_finished(self, item_id: str, result: dict):
         # Decrease current downloads and active downloads
         self.current_downloads -= 1
         self.active_downloads -= 1
+        # Drop any undrained progress so it can't overwrite the final state
+        with self._pending_lock:
+            self._pending.pop(item_id, None)
+        self._last_progress_emit.pop(item_id, None)
 
         if item_id in self.download_widgets:
             if result['success']:
                 self.completed_downloads += 1
-                self.download_widgets[item_id].set_completed()
+                self._set_item_status(item_id, self.download_widgets[item_id], "completed")
+                self._retire_completed_row(item_id)
                 self.log_message(f"✅ {result.get('message', 'Download completed')}")
             else:
                 self.failed_downloads += 1
-                self.download_widgets[item_id].set_failed(result.get('message', 'Unknown error'))
+                self._set_item_status(item_id, self.download_widgets[item_id], "failed", result.get('message', 'Unknown error'))
                 self.log_message(f"❌ {result.get('message', 'Download failed')} - Skipping to next video")
 
         # Remove worker reference
@@ -1269,13 +1528,11 @@ class YouTubeDownloaderGUI(QWidget):
             self.log_message("⏸ Downloads paused - current downloads will complete, queue paused")
             
             # Pause only the workers that are currently downloading
-            for worker in self.workers.values():
-                worker.pause()
-                
-            # Update UI for downloading items to show paused status
-            for item_id, widget in self.download_widgets.items():
-                if widget.status_label.text() == "⬇️":
-                    widget.set_paused()
+            for item_id in tuple(self._widgets_by_status["downloading"]):
+                worker = self.workers.get(item_id)
+                if worker is not None:
+                    worker.pause()
+                self._set_item_status(item_id, self.download_widgets[item_id], "paused")
                     
             # Don't start new downloads from queue while paused
             self.log_message("⏳ Queue paused - remaining downloads will stay queued until resume")
@@ -1285,13 +1542,11 @@ class YouTubeDownloaderGUI(QWidget):
             self.log_message("▶️ Downloads resumed")
             
             # Resume workers that are currently paused
-            for worker in self.workers.values():
-                worker.resume()
-                
-            # Update UI for paused items back to downloading
-            for item_id, widget in self.download_widgets.items():
-                if widget.status_label.text() == "⏸️":
-                    widget.set_downloading()
+            for item_id in tuple(self._widgets_by_status["paused"]):
+                worker = self.workers.get(item_id)
+                if worker is not None:
+                    worker.resume()
+                self._set_item_status(item_id, self.download_widgets[item_id], "downloading")
                     
             # Resume queue processing - start next downloads if slots are available
             if len(self.download_queue) > 0:
@@ -1301,7 +1556,8 @@ class YouTubeDownloaderGUI(QWidget):
     def cancel_downloads(self):
         self.log_message("\n❌ Cancelling all downloads...")
 
-        for worker in self.workers.values():
+        # Snapshot: finished handlers may drop entries from self.workers
+        for worker in tuple(self.workers.values()):
             worker.stop()
 
         # Clear download queue and reset pause state